@@ -0,0 +1,42 @@
+"""Batch evaluation with calc_batch against looping over calc().
+
+usage: python benchmark.py [pairs]   (default 1,000,000)
+"""
+import array
+import random
+import sys
+import time
+
+from calculator import calc, calc_batch, np
+
+
+def timed(label, pairs, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f'{label:26}: {elapsed:6.3f}s  {pairs / elapsed / 1e6:8.2f} M pairs/sec')
+
+
+def loop_calc(a, b, op):
+    """The one-pair-at-a-time approach, guarding division by zero by hand."""
+    results = []
+    for x, y in zip(a, b):
+        try:
+            results.append(calc(x, y, op))
+        except ZeroDivisionError:
+            results.append(float('nan'))
+    return results
+
+
+if __name__ == '__main__':
+    pairs = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(5)
+    a = [rng.randint(-1000, 1000) for _ in range(pairs)]
+    b = [rng.randint(-10, 10) for _ in range(pairs)]  # plenty of zeros
+    columns = [('list', a, b), ('array.array', array.array('q', a), array.array('q', b))]
+    if np is not None:
+        columns.append(('numpy', np.array(a), np.array(b)))
+    for op in ('+', '/'):
+        timed(f'loop calc {op}', pairs, lambda: loop_calc(a, b, op))
+        for label, x, y in columns:
+            timed(f'calc_batch {label} {op}', pairs, lambda: calc_batch(x, y, op))
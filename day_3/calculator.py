@@ -1,3 +1,11 @@
+import array
+import math
+import operator
+try:
+    import numpy as np
+except ImportError:  # batch mode falls back to plain Python loops
+    np = None
+
 def add(a,b):
     return calc(a,b,"+")
 def sub(a,b):
@@ -17,14 +25,66 @@ def calc(a,b,op):
         return a / b
     else:
         raise ValueError("Unknown operator")
-#userinput
-a = int(input("Enter the first number: "))
-operation = input("Enter the operation:add,sub,mul,div ")
-ops = {"add": add, "sub": sub, "mul": mul, "div": div}
-b = int(input("Enter the second number: "))
-
-if operation not in ops:
-    print("Invalid operation")
-else:
-    func=ops[operation](a,b)
-    print(func)
+
+BATCH_OPS = {"+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.truediv}
+NUMPY_OPS = {"+": "add", "-": "subtract", "*": "multiply", "/": "true_divide"}
+
+def _safe_div(a,b):
+    return a / b if b else math.nan
+
+def _numpy_column(c):
+    """c as a NumPy array; array.array is wrapped without copying unless its
+    items are narrower than 64 bits, then it is widened to int64/float64 so
+    array('b') columns do not wrap around where Python ints would not"""
+    if not isinstance(c, array.array):
+        return np.asarray(c)
+    c = np.frombuffer(c, dtype=c.typecode)
+    if c.dtype.itemsize < 8:
+        return c.astype(np.float64 if c.dtype.kind == "f" else np.int64)
+    return c
+
+def calc_batch(a,b,op):
+    """apply op to whole columns of operands, element by element
+    a, b: equal-length lists, array.array or NumPy arrays
+    division by zero gives nan for that element instead of raising
+    NumPy arrays (and array.array when NumPy is installed) are evaluated
+    vectorized and return a NumPy array; lists return a list"""
+    if op not in BATCH_OPS:
+        raise ValueError("Unknown operator")
+    if len(a) != len(b):
+        raise ValueError("operand columns have different lengths")
+    columns = (a, b)
+    if np is not None and any(isinstance(c, (np.ndarray, array.array)) for c in columns):
+        a, b = map(_numpy_column, columns)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = getattr(np, NUMPY_OPS[op])(a, b)
+        if op == "/":
+            result[b == 0] = np.nan
+        return result
+    if op == "/":
+        return list(map(_safe_div, a, b))
+    return list(map(BATCH_OPS[op], a, b))
+
+def calc_file(filename,op):
+    """calc_batch over a file of "a,b" lines, read into two float columns"""
+    a, b = array.array("d"), array.array("d")
+    with open(filename, "r", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                first, second = line.split(",")
+                a.append(float(first))
+                b.append(float(second))
+    return calc_batch(a, b, op)
+
+if __name__ == "__main__":
+    #userinput
+    a = int(input("Enter the first number: "))
+    operation = input("Enter the operation:add,sub,mul,div ")
+    ops = {"add": add, "sub": sub, "mul": mul, "div": div}
+    b = int(input("Enter the second number: "))
+
+    if operation not in ops:
+        print("Invalid operation")
+    else:
+        func=ops[operation](a,b)
+        print(func)
@@ -0,0 +1,76 @@
+"""Throughput of the phone/email extractor in MB/s.
+
+usage: python benchmark.py [size_in_mb] [files]   (default 200 MB in 8 files)
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from extractor import email_pattern, extract_file, extract_files, extract_text, phone_pattern
+
+WORDS = ['the', 'meeting', 'moved', 'to', 'Tuesday,', 'please', 'call', 'or', 'write', 'ERROR', 'timeout', '42']
+
+
+def make_corpus(path, size_mb, seed):
+    """Write mail/log-like text where roughly one token in twenty is an entity."""
+    rng = random.Random(seed)
+    tokens = []
+    for _ in range(50_000):
+        roll = rng.random()
+        if roll < 0.03:
+            tokens.append(f'{rng.randint(200, 999)}-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}')
+        elif roll < 0.05:
+            tokens.append(f'user{rng.randint(0, 5000)}@example{rng.randint(0, 9)}.com')
+        else:
+            tokens.append(rng.choice(WORDS))
+    block = ' '.join(tokens) + '\n'
+    with open(path, 'w', encoding='utf-8') as file:
+        for _ in range(max(1, size_mb * 1024 * 1024 // len(block))):
+            file.write(block)
+
+
+def timed(label, size_mb, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f'{label:22}: {elapsed:6.2f}s  {size_mb / elapsed:7.1f} MB/s')
+    return result
+
+
+def read_and_findall(paths):
+    """The original approach: whole text in memory, findall with group tuples."""
+    phone_numbers, emails = set(), set()
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as file:
+            text = file.read()
+        phone_numbers.update(match[0] for match in phone_pattern.findall(text))
+        emails.update(email_pattern.findall(text))
+    return phone_numbers, emails
+
+
+if __name__ == '__main__':
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [os.path.join(directory, f'mail{i}.txt') for i in range(count)]
+        for i, path in enumerate(paths):
+            make_corpus(path, max(1, size_mb // count), i)
+        size_mb = sum(os.path.getsize(p) for p in paths) / 1024 / 1024
+
+        expected = timed('read + findall', size_mb, lambda: read_and_findall(paths))
+        results = [
+            timed('streaming, 1 process', size_mb, lambda: extract_files(paths, workers=1)),
+            timed(f'streaming, {os.cpu_count()} processes', size_mb, lambda: extract_files(paths, workers=None)),
+        ]
+        assert all(result == expected for result in results), 'extractors disagree'
+        timed('single file stream', size_mb / count, lambda: extract_file(paths[0]))
+
+        # in-memory engines on one file: two findall passes vs the single pass
+        with open(paths[0], 'r', encoding='utf-8') as file:
+            text = file.read()
+        two_pass = timed('two-pass findall', size_mb / count, lambda: (
+            [match[0] for match in phone_pattern.findall(text)], email_pattern.findall(text)))
+        single_pass = timed('single-pass engine', size_mb / count, lambda: extract_text(text))
+        assert two_pass == single_pass, 'engines disagree'
@@ -1,5 +1,8 @@
+import argparse
+import heapq
+import os
 import re
-import pyperclip
+from concurrent.futures import ProcessPoolExecutor
 
 # Define regex pattern for phone numbers (US-style example)
 phone_pattern = re.compile(r'''
@@ -23,23 +26,166 @@ email_pattern = re.compile(r'''
     )
 ''', re.VERBOSE)
 
-# Get text from clipboard
-text = pyperclip.paste()
+# Same matches as phone_pattern, but the lookahead on the first character
+# lets the regex engine skip every position that cannot start a number
+# instead of trying the optional groups there.
+phone_prefiltered = re.compile(r'(?=[+(\d])' + phone_pattern.pattern, re.VERBOSE)
+EMAIL_USER_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-')
 
-# Find all phone numbers and emails in the text
-phones = phone_pattern.findall(text)
-emails = email_pattern.findall(text)
+KINDS = ('phone', 'email')
+CHUNK_SIZE = 1024 * 1024  # characters read from a file at a time
+OVERLAP = 1024  # characters kept between chunks; longer matches may be cut
 
-# Extract full phone numbers from groups
-phone_numbers = [match[0] for match in phones]
 
-# Combine results
-results = phone_numbers + emails
+def _iter_emails(text, pos=0):
+    """Yield the same matches as email_pattern.finditer(text, pos).
 
-if results:
-    # Copy results to clipboard as newline separated string
-    pyperclip.copy('\n'.join(results))
-    print("Phone numbers and emails copied to clipboard:")
-    print('\n'.join(results))
-else:
-    print("No phone numbers or emails found.")
+    Only the text around each '@' is handed to the regex: a match has to
+    start inside the run of username characters right before its '@'.
+    """
+    at = text.find('@', pos)
+    while at != -1:
+        start = at
+        while start > pos and text[start - 1] in EMAIL_USER_CHARS:
+            start -= 1
+        for candidate in range(start, at):
+            match = email_pattern.match(text, candidate)
+            if match:
+                yield match
+                pos = match.end()
+                break
+        at = text.find('@', max(at + 1, pos))
+
+
+def iter_entities(text, phone_pos=0, email_pos=0):
+    """Yield (kind, match) for phone numbers and emails, ordered by position.
+
+    Single pass over the text: phone numbers come from the prefiltered
+    pattern and emails are only looked for around '@'. The matches are the
+    same as running phone_pattern and email_pattern separately.
+    """
+    phones = (('phone', match) for match in phone_prefiltered.finditer(text, phone_pos))
+    emails = (('email', match) for match in _iter_emails(text, email_pos))
+    return heapq.merge(phones, emails, key=lambda entity: entity[1].start())
+
+
+def extract_entities(text):
+    """Return [(kind, value)] for every phone number and email in text, in order."""
+    return [(kind, match.group()) for kind, match in iter_entities(text)]
+
+
+def extract_text(text):
+    """Return (phone_numbers, emails) found in text, in order of appearance."""
+    found = {kind: [] for kind in KINDS}
+    for kind, match in iter_entities(text):
+        # group 0 is the full match, no need to build the group tuples
+        found[kind].append(match.group())
+    return found['phone'], found['email']
+
+
+def iter_matches(file, chunk_size=CHUNK_SIZE, overlap=OVERLAP):
+    """Yield (kind, value) for every phone number and email in a text file.
+
+    The file is read chunk by chunk. Matches starting in the last `overlap`
+    characters of a chunk are held back and found again, complete, in the
+    next chunk, so nothing shorter than `overlap` is lost or cut at a
+    boundary. Each pattern resumes where its previous match ended, exactly
+    as one findall() over the whole text would.
+    """
+    buffer = ''
+    offset = 0  # position of buffer[0] in the whole file
+    resume = {kind: 0 for kind in KINDS}
+    while True:
+        data = file.read(chunk_size)
+        buffer += data
+        final = not data
+        if final:
+            cut = len(buffer)
+        elif len(buffer) < 2 * overlap:
+            continue
+        else:
+            # Start the next chunk on whitespace so no word is entered midway
+            limit = len(buffer) - overlap
+            cut = max(buffer.rfind(' ', 0, limit), buffer.rfind('\n', 0, limit)) + 1 or limit
+        for kind, match in iter_entities(buffer, max(0, resume['phone'] - offset),
+                                         max(0, resume['email'] - offset)):
+            if match.start() >= cut:
+                break
+            yield kind, match.group()
+            resume[kind] = offset + match.end()
+        if final:
+            return
+        buffer = buffer[cut:]
+        offset += cut
+
+
+def extract_file(path, chunk_size=CHUNK_SIZE, overlap=OVERLAP):
+    """Return the sets of (phone_numbers, emails) found in a file."""
+    found = {kind: set() for kind in KINDS}
+    with open(path, 'r', encoding='utf-8', errors='replace') as file:
+        for kind, value in iter_matches(file, chunk_size, overlap):
+            found[kind].add(value)
+    return found['phone'], found['email']
+
+
+def _expand_paths(paths):
+    """Yield the files named in paths, walking directories recursively."""
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, _, filenames in os.walk(path):
+                for filename in sorted(filenames):
+                    yield os.path.join(directory, filename)
+        else:
+            yield path
+
+
+def extract_files(paths, workers=1):
+    """Return the deduplicated (phone_numbers, emails) sets over many files.
+
+    With workers > 1 (or None for one per CPU) files are scanned in a
+    process pool.
+    """
+    files = list(_expand_paths(paths))
+    phone_numbers, emails = set(), set()
+    if workers == 1 or len(files) <= 1:
+        for phones, mails in map(extract_file, files):
+            phone_numbers |= phones
+            emails |= mails
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for phones, mails in executor.map(extract_file, files, chunksize=4):
+                phone_numbers |= phones
+                emails |= mails
+    return phone_numbers, emails
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Extract phone numbers and emails from files or the clipboard.')
+    parser.add_argument('paths', nargs='*', help='files or directories to scan (default: clipboard)')
+    parser.add_argument('-w', '--workers', type=int, default=1, help='processes used to scan files (0 = one per CPU)')
+    parser.add_argument('--copy', action='store_true', help='copy the results to the clipboard')
+    args = parser.parse_args(argv)
+    if not args.paths or args.copy:
+        import pyperclip  # only needed for clipboard access
+
+    if args.paths:
+        phone_numbers, emails = extract_files(args.paths, args.workers or None)
+        results = sorted(phone_numbers) + sorted(emails)
+    else:
+        # Get text from clipboard
+        phone_numbers, emails = extract_text(pyperclip.paste())
+        results = phone_numbers + emails
+        args.copy = True
+
+    if results:
+        if args.copy:
+            # Copy results to clipboard as newline separated string
+            pyperclip.copy('\n'.join(results))
+            print("Phone numbers and emails copied to clipboard:")
+        print('\n'.join(results))
+    else:
+        print("No phone numbers or emails found.")
+
+
+if __name__ == '__main__':
+    main()
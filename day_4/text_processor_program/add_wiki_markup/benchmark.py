@@ -0,0 +1,46 @@
+"""Compare the original read/split/join markup script with the streaming converter.
+
+usage: python benchmark.py [size_in_mb]   (default 500)
+"""
+import os
+import sys
+import tempfile
+import time
+
+from markup import convert_file
+
+
+def original(input_path, output_path):
+    """The previous markup.py body."""
+    with open(input_path, 'r', encoding='utf-8') as fileinput, \
+            open(output_path, 'w', encoding='utf-8') as fileoutput:
+        arr = []
+        lines = fileinput.read().split('\n')
+        for line in lines:
+            word = line.strip()
+            arr.append("*" + word)
+        value = '\n'.join(arr)
+        fileoutput.write(value)
+
+
+def timed(label, size_mb, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f'{label:10}: {elapsed:6.2f}s  {size_mb / elapsed:7.1f} MB/s')
+
+
+if __name__ == '__main__':
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'input.txt')
+        line = '  some exported line of text with a few words in it  \n'
+        with open(source, 'w', encoding='utf-8') as file:
+            block = line * 10000
+            for _ in range(size_mb * 1024 * 1024 // len(block)):
+                file.write(block)
+        outputs = [os.path.join(directory, name) for name in ('original.txt', 'streaming.txt')]
+        timed('original', size_mb, lambda: original(source, outputs[0]))
+        timed('streaming', size_mb, lambda: convert_file(source, outputs[1]))
+        with open(outputs[0], 'rb') as first, open(outputs[1], 'rb') as second:
+            assert first.read() == second.read(), 'outputs differ'
@@ -1,9 +1,81 @@
-with open('input.txt' ,'r', encoding='utf-8') as fileinput, \
-    open('output.txt','w', encoding='utf-8') as fileoutput:
-    arr=[]
-    lines=fileinput.read().split('\n')
-    for line in lines:
-        word=line.strip()
-        arr.append("*"+word)
-    value='\n'.join(arr)
-    fileoutput.write(value)
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+BATCH_LINES = 10000  # converted lines joined into one write()
+WRITE_BUFFER = 1024 * 1024
+
+
+def convert_stream(fileinput, fileoutput, batch_lines=BATCH_LINES):
+    """Prefix every line with '*' (stripped), streaming line by line.
+
+    Produces the same text as '\\n'.join('*' + line.strip() for line in
+    read().split('\\n')) without holding the input or the output in memory:
+    every line of the input becomes one output line, and text ending in a
+    newline gets a final lone '*'. Returns the number of lines written.
+    """
+    batch = []
+    count = 0
+    ended_with_newline = True  # an empty input is one empty line
+    for line in fileinput:
+        ended_with_newline = line.endswith('\n')
+        batch.append("*" + line.strip())
+        if len(batch) >= batch_lines:
+            fileoutput.write(('\n' if count else '') + '\n'.join(batch))
+            count += len(batch)
+            batch = []
+    if ended_with_newline:
+        batch.append("*")
+    if batch:
+        fileoutput.write(('\n' if count else '') + '\n'.join(batch))
+        count += len(batch)
+    return count
+
+
+def _open(path, mode):
+    """Open path for text I/O, with '-' meaning stdin/stdout."""
+    if path == '-':
+        stream = sys.stdin if mode == 'r' else sys.stdout
+        return open(stream.fileno(), mode, encoding='utf-8', buffering=WRITE_BUFFER, closefd=False)
+    return open(path, mode, encoding='utf-8', buffering=WRITE_BUFFER)
+
+
+def convert_file(input_path='input.txt', output_path='output.txt'):
+    with _open(input_path, 'r') as fileinput, _open(output_path, 'w') as fileoutput:
+        return convert_stream(fileinput, fileoutput)
+
+
+def convert_directory(input_dir, output_dir, workers=None):
+    """Convert every file of input_dir into output_dir, one process per file at a time."""
+    if os.path.isdir(output_dir) and os.path.samefile(input_dir, output_dir):
+        # every output is truncated before its input is read
+        raise ValueError('output directory must differ from the input directory')
+    os.makedirs(output_dir, exist_ok=True)
+    names = sorted(name for name in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, name)))
+    inputs = [os.path.join(input_dir, name) for name in names]
+    outputs = [os.path.join(output_dir, name) for name in names]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(names, executor.map(convert_file, inputs, outputs)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Add a '*' wiki bullet to every line of a text file.")
+    parser.add_argument('input', nargs='?', default='input.txt', help="input file, directory or '-' for stdin")
+    parser.add_argument('output', nargs='?', default=None,
+                        help="output file (default output.txt), directory (required for a directory input) or '-' for stdout")
+    parser.add_argument('-w', '--workers', type=int, default=None, help='processes used for a directory')
+    args = parser.parse_args(argv)
+    if os.path.isdir(args.input):
+        if args.output is None:
+            parser.error('an input directory needs an output directory')
+        try:
+            convert_directory(args.input, args.output, args.workers)
+        except ValueError as error:
+            parser.error(str(error))
+    else:
+        convert_file(args.input, args.output or 'output.txt')
+
+
+if __name__ == '__main__':
+    main()
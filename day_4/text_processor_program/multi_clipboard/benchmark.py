@@ -0,0 +1,49 @@
+"""CPU overhead of the ClipboardManager background watcher.
+
+Runs the watcher against a fake in-memory clipboard (no pyperclip needed):
+first idle, then with the value changing, and reports process CPU time as a
+percentage of wall time.
+
+usage: python benchmark.py [seconds]   (default 10 per phase)
+"""
+import sys
+import time
+
+from clipboard import ClipboardManager
+
+
+class FakeClipboard:
+    def __init__(self, value=''):
+        self.value = value
+        self.pastes = 0
+
+    def paste(self):
+        self.pastes += 1
+        return self.value
+
+    def copy(self, value):
+        self.value = value
+
+
+def measure(label, seconds, changer=None):
+    clipboard = FakeClipboard('x' * 100_000)
+    manager = ClipboardManager(backend=clipboard)
+    captured = []
+    manager.subscribe(captured.append)
+    wall, cpu = time.perf_counter(), time.process_time()
+    manager.start_watching()
+    deadline = wall + seconds
+    while time.perf_counter() < deadline:
+        if changer:
+            changer(clipboard)
+        time.sleep(0.5)
+    manager.stop_watching()
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    print(f'{label:8}: {100 * cpu / wall:6.3f}% CPU, {clipboard.pastes} polls, {len(captured)} values captured')
+
+
+if __name__ == '__main__':
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    measure('idle', seconds)
+    counter = iter(range(10**9))
+    measure('changing', seconds, lambda clipboard: clipboard.copy(f'value {next(counter)}'))
@@ -1,28 +1,185 @@
-import pyperclip
+import hashlib
+import os
+import threading
+from collections import OrderedDict
 
 class ClipboardManager:
-    def __init__(self):
-        self.history = []
+    """Clipboard history bounded by entry count and in-memory bytes.
+
+    Values are indexed by a hash of their content, so a value seen again is
+    not stored twice but moved to the most recent position. With spill_dir
+    set, values larger than spill_threshold bytes are written there and only
+    their hash stays in memory.
+
+    backend is any object with paste() and copy(text); it defaults to
+    pyperclip, and tests can pass a fake clipboard instead.
+    """
+    def __init__(self, max_entries=100, max_bytes=10 * 1024 * 1024,
+                 spill_dir=None, spill_threshold=64 * 1024, backend=None):
+        if backend is None:
+            import pyperclip
+            backend = pyperclip
+        self.backend = backend
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.spill_threshold = spill_threshold
+        self._entries = OrderedDict()  # digest -> value (None when spilled), oldest first
+        self._sizes = {}  # digest -> size in bytes of an in-memory value
+        self.memory_bytes = 0
         self.current_value = None
+        self._current_digest = None
+        self._lock = threading.Lock()  # guards the history, shared with the watcher thread
+        self._subscribers = []
+        self._watcher = None
+        self._stop = threading.Event()
 
-    def get_clipboard(self):
-        value = pyperclip.paste()
-        if value != self.current_value:
-            self.history.append(value)
+    @staticmethod
+    def _digest(data):
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _spill_path(self, digest):
+        return os.path.join(self.spill_dir, digest + '.txt')
+
+    def _load(self, digest):
+        value = self._entries[digest]
+        if value is None:
+            with open(self._spill_path(digest), 'r', encoding='utf-8', newline='') as file:
+                value = file.read()
+        return value
+
+    def _forget(self, digest):
+        if self._entries.pop(digest) is None:
+            try:
+                os.remove(self._spill_path(digest))
+            except FileNotFoundError:
+                pass
+        else:
+            self.memory_bytes -= self._sizes.pop(digest)
+
+    def seen(self, value):
+        """O(1) check whether value is in the history."""
+        digest = self._digest(value.encode('utf-8'))
+        with self._lock:
+            return digest in self._entries
+
+    def add_to_history(self, value):
+        """Record value as the most recent entry; returns False if it was already there,
+        or if it is larger than max_bytes and there is no spill_dir to hold it."""
+        with self._lock:
+            return self._add(value)
+
+    def _add(self, value):
+        # callers hold self._lock
+        data = value.encode('utf-8')
+        digest = self._digest(data)
+        if digest in self._entries:
+            self._entries.move_to_end(digest)
+            return False
+        spill = self.spill_dir and (len(data) > self.spill_threshold or len(data) > self.max_bytes)
+        if not spill and len(data) > self.max_bytes:
+            return False  # would evict the whole history and then itself
+        if spill:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            with open(self._spill_path(digest), 'wb') as file:
+                file.write(data)
+            self._entries[digest] = None
+        else:
+            self._entries[digest] = value
+            self._sizes[digest] = len(data)
+            self.memory_bytes += len(data)
+        # Evict the least recently seen values until both limits hold, never the new one
+        while len(self._entries) > self.max_entries or self.memory_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            if oldest == digest:
+                break
+            self._forget(oldest)
+        return True
+
+    @property
+    def history(self):
+        """History values, least recently seen first."""
+        with self._lock:
+            return [self._load(digest) for digest in self._entries]
+
+    def clear_history(self):
+        # only the spill files of this history are removed, never the directory
+        with self._lock:
+            for digest in list(self._entries):
+                self._forget(digest)
+
+    def _observe(self, value):
+        """Record a clipboard sample; returns True when it differs from the last one."""
+        digest = self._digest(value.encode('utf-8'))
+        with self._lock:
+            if digest == self._current_digest:
+                return False
+            self._current_digest = digest
             self.current_value = value
+            self._add(value)
+        for callback in list(self._subscribers):
+            callback(value)
+        return True
+
+    def get_clipboard(self):
+        value = self.backend.paste()
+        self._observe(value)
         return value
 
+    def subscribe(self, callback):
+        """Call callback(value) for every new clipboard value."""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        self._subscribers.remove(callback)
+
+    @property
+    def watching(self):
+        return self._watcher is not None and self._watcher.is_alive()
+
+    def start_watching(self, min_interval=0.1, max_interval=2.0, backoff=1.5):
+        """Poll the clipboard in a background thread.
+
+        The interval drops back to min_interval whenever the value changes
+        and grows by backoff (up to max_interval) while it stays the same,
+        so an idle clipboard costs only a few polls per second.
+        """
+        if self.watching:
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(target=self._watch, args=(min_interval, max_interval, backoff),
+                                         name='clipboard-watcher', daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+    def _watch(self, min_interval, max_interval, backoff):
+        interval = min_interval
+        while not self._stop.is_set():
+            try:
+                changed = self._observe(self.backend.paste())
+            except Exception as error:  # a flaky clipboard must not kill the watcher
+                print(f"Clipboard watcher error: {error}")
+                changed = False
+            interval = min_interval if changed else min(interval * backoff, max_interval)
+            self._stop.wait(interval)
+
     def show_history(self):
-        if self.history:
-            for idx, value in enumerate(self.history, start=1):
+        values = self.history
+        if values:
+            for idx, value in enumerate(values, start=1):
                 print(f"{idx}: {value}")
         else:
             print("No history available.")
 
     def clear_clipboard(self):
-        pyperclip.copy('')
+        self.backend.copy('')
         #self.current_value = '' #extra precaution
-        self.history = []  # Clear the history as well
+        self.clear_history()  # Clear the history as well
         print("Clipboard cleared.")
 if __name__ == "__main__":
     manager = ClipboardManager()
@@ -31,8 +188,9 @@ if __name__ == "__main__":
         print("1. Get current clipboard value")
         print("2. Show clipboard history")
         print("3. Clear clipboard")
-        print("4. Exit")
-        choice = input("Enter your choice (1-4): ")
+        print("4. Start/stop background watcher")
+        print("5. Exit")
+        choice = input("Enter your choice (1-5): ")
         if choice == '1':
             current_value = manager.get_clipboard()
             print(f"Current clipboard value: {current_value}")
@@ -41,7 +199,15 @@ if __name__ == "__main__":
         elif choice == '3':
             manager.clear_clipboard()
         elif choice == '4':
+            if manager.watching:
+                manager.stop_watching()
+                print("Background watcher stopped.")
+            else:
+                manager.start_watching()
+                print("Background watcher started.")
+        elif choice == '5':
+            manager.stop_watching()
             print("Exiting...")
             break
         else:
-            print("Invalid choice. Please enter a number from 1 to 4.")
+            print("Invalid choice. Please enter a number from 1 to 5.")
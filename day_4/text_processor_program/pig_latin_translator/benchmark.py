@@ -0,0 +1,68 @@
+"""Translate a repetitive corpus with the original per-word loop and with the
+cached, line-streaming translator.
+
+usage: python benchmark.py [size_in_mb]   (default 100)
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from translator import pig_latin, translate_file, translate_word
+
+SENTENCES = [
+    'The quick brown fox jumps over the lazy dog.',
+    'Python makes string processing simple, readable and fast!',
+    'She said: "Rhythm and blues never go out of style."',
+    'Every morning the team reviews the open tickets together.',
+]
+
+
+def original_pig_latin(value):
+    """The previous pig_latin: list of vowels, character by character."""
+    vowels = ['a', 'e', 'i', 'o', 'u']
+    value = value.lower()
+    if value[0] in vowels:
+        return value + 'yay'
+    else:
+        for i, char in enumerate(value):
+            if char in vowels:
+                return value[i:] + value[:i] + 'ay'
+        return value + 'ay'
+
+
+def original(input_path, output_path):
+    """The previous tokenizer applied to every line of the file."""
+    with open(input_path, 'r', encoding='utf-8') as fileinput, \
+            open(output_path, 'w', encoding='utf-8') as fileoutput:
+        for line in fileinput:
+            fileoutput.write(' '.join(original_pig_latin(word) for word in line.split()) + '\n')
+
+
+def streaming(input_path, output_path):
+    with open(input_path, 'r', encoding='utf-8') as fileinput, \
+            open(output_path, 'w', encoding='utf-8') as fileoutput:
+        translate_file(fileinput, fileoutput)
+
+
+def timed(label, size_mb, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f'{label:10}: {elapsed:6.2f}s  {size_mb / elapsed:7.1f} MB/s')
+
+
+if __name__ == '__main__':
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    rng = random.Random(3)
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'corpus.txt')
+        block = ''.join(rng.choice(SENTENCES) + '\n' for _ in range(10000))
+        with open(source, 'w', encoding='utf-8') as file:
+            for _ in range(size_mb * 1024 * 1024 // len(block)):
+                file.write(block)
+        timed('original', size_mb, lambda: original(source, os.path.join(directory, 'original.txt')))
+        timed('streaming', size_mb, lambda: streaming(source, os.path.join(directory, 'streaming.txt')))
+        print('word cache:', translate_word.cache_info())
+        print('pig_latin cache:', pig_latin.cache_info())
@@ -1,13 +1,63 @@
+import re
+import sys
+from functools import lru_cache
+
+VOWELS = frozenset('aeiou')
+FIRST_VOWEL = re.compile('[aeiou]')
+# Words are letter runs, optionally joined by apostrophes (don't, o'clock);
+# everything else (spaces, digits, punctuation) is copied through untouched
+WORD = re.compile(r"([A-Za-z]+(?:'[A-Za-z]+)*)")
+CACHE_SIZE = 100_000  # distinct words remembered by the translator
+
+
+@lru_cache(maxsize=CACHE_SIZE)
 def pig_latin(value):
-    vowels = ['a','e','i','o','u']
     value = value.lower()
-    if value[0] in vowels:
+    if not value:
+        return value
+    if value[0] in VOWELS:
         return value + 'yay'
-    else:
-        for i, char in enumerate(value):
-            if char in vowels:
-                return value[i:] + value[:i] + 'ay'
-        return value + 'ay'  # if no vowels found
+    match = FIRST_VOWEL.search(value)
+    if match:
+        i = match.start()
+        return value[i:] + value[:i] + 'ay'
+    return value + 'ay'  # if no vowels found
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def translate_word(word):
+    """pig_latin() that keeps the word's case: hello, Hello, HELLO."""
+    translated = pig_latin(word)
+    if len(word) > 1 and word.isupper():
+        return translated.upper()
+    if word[0].isupper():
+        return translated.capitalize()
+    return translated
+
+
+def translate_text(text):
+    """Translate every word of text, preserving punctuation, spacing and case."""
+    # split() with a group alternates separators and words: words are the odd items
+    parts = WORD.split(text)
+    parts[1::2] = map(translate_word, parts[1::2])
+    return ''.join(parts)
+
+
+def translate_lines(lines):
+    """Lazily translate an iterable of lines (e.g. an open file)."""
+    return map(translate_text, lines)
+
+
+def translate_file(fileinput, fileoutput, batch_lines=10000):
+    """Stream fileinput to fileoutput line by line, writing in batches."""
+    batch = []
+    for line in translate_lines(fileinput):
+        batch.append(line)
+        if len(batch) >= batch_lines:
+            fileoutput.write(''.join(batch))
+            batch = []
+    fileoutput.write(''.join(batch))
+
 
 def tokenizer(sentence):
     arr2=[]
@@ -16,5 +66,17 @@ def tokenizer(sentence):
         arr2.append(pig_latin(word))
     statement=" ".join(arr2)
     return statement
-phrase=input("enter your sentence here \n ")
-print(tokenizer(phrase))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        # translator.py input.txt [output.txt]: translate a whole file
+        with open(sys.argv[1], 'r', encoding='utf-8') as fileinput:
+            if len(sys.argv) > 2:
+                with open(sys.argv[2], 'w', encoding='utf-8') as fileoutput:
+                    translate_file(fileinput, fileoutput)
+            else:
+                translate_file(fileinput, sys.stdout)
+    else:
+        phrase=input("enter your sentence here \n ")
+        print(tokenizer(phrase))
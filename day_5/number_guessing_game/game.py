@@ -1,4 +1,14 @@
+import bisect
 import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+MESSAGES = {'close': 'Very close', 'low': 'Very low', 'high': 'Very high'}
+CHUNK_ROUNDS = 20000  # rounds simulated per worker task
+
+
 def get_settings_for_difficulty(difficulty: str) -> tuple[int, int, int]:
     # returns (min_value, max_value, closeness_threshold)
     difficulty = difficulty.lower().strip()
@@ -11,9 +21,19 @@ def get_settings_for_difficulty(difficulty: str) -> tuple[int, int, int]:
     raise ValueError('Invalid difficulty')
 
 
-def play_round(min_value: int, max_value: int, close_threshold: int, attempts_remaining: int) -> tuple[int, bool]:
+def feedback(guess: int, target_number: int, close_threshold: int) -> str:
+    # returns 'correct', 'close', 'low' or 'high', as told to the player
+    if guess == target_number:
+        return 'correct'
+    if abs(guess - target_number) <= close_threshold:
+        return 'close'
+    return 'low' if guess < target_number else 'high'
+
+
+def play_round(min_value: int, max_value: int, close_threshold: int, attempts_remaining: int,
+               rng: random.Random = random) -> tuple[int, bool]:
     # returns (attempts_remaining_after_round, won_this_round)
-    target_number = random.randint(min_value, max_value)
+    target_number = rng.randint(min_value, max_value)
     while attempts_remaining > 0:
         raw = input(f'Guess a number between {min_value} and {max_value} (attempts left {attempts_remaining}, or Q to quit round): ').strip()
         if raw.lower() == 'q':
@@ -23,17 +43,11 @@ def play_round(min_value: int, max_value: int, close_threshold: int, attempts_re
             continue
         guess = int(raw)
 
-        if guess == target_number:
+        result = feedback(guess, target_number, close_threshold)
+        if result == 'correct':
             print('Hurray, you got it!')
             return attempts_remaining, True
-
-        difference = abs(guess - target_number)
-        if difference <= close_threshold:
-            print('Very close')
-        elif guess < target_number:
-            print('Very low')
-        else:
-            print('Very high')
+        print(MESSAGES[result])
 
         attempts_remaining -= 1
 
@@ -41,6 +55,164 @@ def play_round(min_value: int, max_value: int, close_threshold: int, attempts_re
     return attempts_remaining, False
 
 
+class random_guess:
+    # guesses uniformly among the numbers still consistent with every feedback
+    def __init__(self, min_value: int, max_value: int, close_threshold: int, attempts: int,
+                 rng: random.Random):
+        self.candidates = list(range(min_value, max_value + 1))
+        self.close_threshold = close_threshold
+        self.rng = rng
+
+    def guess(self) -> int:
+        return self.rng.choice(self.candidates)
+
+    def update(self, guess: int, result: str) -> None:
+        # candidates stay sorted, so each feedback keeps one slice of them
+        candidates = self.candidates
+        low = bisect.bisect_left(candidates, guess - self.close_threshold)
+        high = bisect.bisect_right(candidates, guess + self.close_threshold)
+        if result == 'low':
+            self.candidates = candidates[high:]
+        elif result == 'high':
+            self.candidates = candidates[:low]
+        else:
+            self.candidates = [value for value in candidates[low:high] if value != guess]
+
+
+class binary_search:
+    # classic bisection on 'low'/'high'; ignores what 'close' says about the distance
+    def __init__(self, min_value: int, max_value: int, close_threshold: int, attempts: int,
+                 rng: random.Random):
+        self.low = min_value
+        self.high = max_value
+        self.guessed = set()
+
+    def guess(self) -> int:
+        guess = (self.low + self.high) // 2
+        while guess in self.guessed and guess < self.high:
+            guess += 1
+        while guess in self.guessed and guess > self.low:
+            guess -= 1
+        return guess
+
+    def update(self, guess: int, result: str) -> None:
+        self.guessed.add(guess)
+        if result == 'low':
+            self.low = guess + 1
+        elif result == 'high':
+            self.high = guess - 1
+
+
+@lru_cache(maxsize=100000)
+def _solve(candidates: tuple, close_threshold: int, attempts: int) -> tuple[int, int, int]:
+    # exact search over every answer: returns (targets won, -attempts used by
+    # them, index of the guess) for the best guess with `attempts` left.
+    # Feedback only depends on guess - target, so candidates are shifted to
+    # start at 0 and equal-shaped sets share one entry.
+    size = len(candidates)
+    if attempts == 1 or size == 1:
+        return 1, -1, 0
+    best = None
+    for i, guess in enumerate(candidates):
+        low = bisect.bisect_left(candidates, guess - close_threshold)
+        high = bisect.bisect_right(candidates, guess + close_threshold)
+        won, used = 1, 1
+        for part in (candidates[:low], candidates[high:], candidates[low:i] + candidates[i + 1:high]):
+            if part:
+                part_won, part_used, _ = _solve(tuple(value - part[0] for value in part),
+                                                close_threshold, attempts - 1)
+                won += part_won
+                used += part_won - part_used  # one more attempt for each target won there
+        if best is None or (won, -used) > best[:2]:
+            best = won, -used, i
+    return best
+
+
+class threshold_search(random_guess):
+    # tracks the exact candidates like random_guess, and plays the guess that
+    # wins the most targets with the attempts left (fewest attempts on ties);
+    # exact, and cheap for the game's 0-50 range
+    def __init__(self, min_value: int, max_value: int, close_threshold: int, attempts: int,
+                 rng: random.Random):
+        super().__init__(min_value, max_value, close_threshold, attempts, rng)
+        self.attempts = attempts
+
+    def guess(self) -> int:
+        first = self.candidates[0]
+        _, _, index = _solve(tuple(value - first for value in self.candidates),
+                             self.close_threshold, self.attempts)
+        return self.candidates[index]
+
+    def update(self, guess: int, result: str) -> None:
+        super().update(guess, result)
+        self.attempts -= 1
+
+
+STRATEGIES = {'random': random_guess, 'binary': binary_search, 'threshold': threshold_search}
+
+
+def simulate_round(min_value: int, max_value: int, close_threshold: int, attempts: int,
+                   strategy: str, rng: random.Random) -> tuple[int, bool]:
+    # headless play_round: returns (attempts_used, won_this_round)
+    target_number = rng.randint(min_value, max_value)
+    player = STRATEGIES[strategy](min_value, max_value, close_threshold, attempts, rng)
+    for used in range(1, attempts + 1):
+        guess = player.guess()
+        result = feedback(guess, target_number, close_threshold)
+        if result == 'correct':
+            return used, True
+        player.update(guess, result)
+    return attempts, False
+
+
+def simulate_rounds(difficulty: str, strategy: str, rounds: int, attempts: int = 10,
+                    seed: str = '0') -> Counter:
+    # returns Counter {attempts_used: wins, ..., 0: losses}; the same seed gives the same rounds
+    min_value, max_value, close_threshold = get_settings_for_difficulty(difficulty)
+    rng = random.Random(seed)
+    outcomes = Counter()
+    for _ in range(rounds):
+        used, won = simulate_round(min_value, max_value, close_threshold, attempts, strategy, rng)
+        outcomes[used if won else 0] += 1
+    return outcomes
+
+
+def _simulate_task(task: tuple) -> tuple[str, str, Counter]:
+    difficulty, strategy, rounds, attempts, seed = task
+    return difficulty, strategy, simulate_rounds(difficulty, strategy, rounds, attempts, seed)
+
+
+def simulate_batch(difficulties=DIFFICULTIES, strategies=tuple(STRATEGIES), rounds: int = 100000,
+                   attempts: int = 10, seed: int = 0, workers=None,
+                   chunk_rounds: int = CHUNK_ROUNDS) -> dict:
+    # returns {(difficulty, strategy): Counter} over `rounds` rounds each, run in
+    # chunks across a process pool; every chunk has its own seed, so the
+    # results do not depend on the number of workers
+    tasks = []
+    for difficulty in difficulties:
+        for strategy in strategies:
+            for chunk, start in enumerate(range(0, rounds, chunk_rounds)):
+                tasks.append((difficulty, strategy, min(chunk_rounds, rounds - start), attempts,
+                              f'{seed}:{difficulty}:{strategy}:{chunk}'))
+    results = {(difficulty, strategy): Counter() for difficulty in difficulties for strategy in strategies}
+    if workers == 1:
+        for difficulty, strategy, counts in map(_simulate_task, tasks):
+            results[difficulty, strategy].update(counts)
+        return results
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for difficulty, strategy, counts in executor.map(_simulate_task, tasks):
+            results[difficulty, strategy].update(counts)
+    return results
+
+
+def summarize(outcomes: Counter) -> tuple[float, float]:
+    # returns (win_rate, mean attempts used by winning rounds)
+    rounds = sum(outcomes.values())
+    wins = rounds - outcomes[0]
+    used = sum(attempts * count for attempts, count in outcomes.items())
+    return (wins / rounds if rounds else 0.0), (used / wins if wins else 0.0)
+
+
 if __name__ == '__main__':
     print('Welcome to Number Guess!')
     total_attempts = 10
@@ -0,0 +1,40 @@
+"""Simulate many headless rounds of the number guessing game.
+
+usage: python simulate.py [-n ROUNDS] [-a ATTEMPTS] [-w WORKERS] [-s SEED]
+                          [-d DIFFICULTY ...] [-p STRATEGY ...]
+
+Prints the win rate, mean attempts of won rounds and the distribution of
+attempts used per difficulty and strategy, then the throughput.
+"""
+import argparse
+import time
+
+from game import DIFFICULTIES, STRATEGIES, simulate_batch, summarize
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Simulate rounds of the number guessing game.')
+    parser.add_argument('-n', '--rounds', type=int, default=100000, help='rounds per difficulty and strategy')
+    parser.add_argument('-a', '--attempts', type=int, default=10, help='attempts allowed per round')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='processes (default: one per CPU)')
+    parser.add_argument('-s', '--seed', type=int, default=0)
+    parser.add_argument('-d', '--difficulty', nargs='+', choices=DIFFICULTIES, default=list(DIFFICULTIES))
+    parser.add_argument('-p', '--strategy', nargs='+', choices=list(STRATEGIES), default=list(STRATEGIES))
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = simulate_batch(args.difficulty, args.strategy, args.rounds, args.attempts, args.seed, args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f'{"difficulty":10} {"strategy":10} {"win rate":>8} {"mean":>5}  attempts used (1..{args.attempts}, lost)')
+    for (difficulty, strategy), outcomes in results.items():
+        win_rate, mean = summarize(outcomes)
+        rounds = sum(outcomes.values())
+        shares = ' '.join(f'{outcomes[used] / rounds:4.0%}' for used in [*range(1, args.attempts + 1), 0])
+        print(f'{difficulty:10} {strategy:10} {win_rate:8.2%} {mean:5.2f}  {shares}')
+    total = sum(sum(outcomes.values()) for outcomes in results.values())
+    print(f'{total} rounds in {elapsed:.2f}s ({total / elapsed:,.0f} rounds/s)')
+
+
+if __name__ == '__main__':
+    main()
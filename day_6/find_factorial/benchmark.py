@@ -0,0 +1,41 @@
+"""Compare the factorial loops with the product tree and the cache.
+
+usage: python benchmark.py [n]   (default 100000)
+"""
+import math
+import random
+import sys
+import time
+
+import factorial as fact
+
+
+def timed(label, n, func):
+    start = time.perf_counter()
+    value = func()
+    elapsed = time.perf_counter() - start
+    print(f'{label:22}: {elapsed:8.3f}s  (n={n})')
+    return value
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    expected = timed('math.factorial', n, lambda: math.factorial(n))
+    results = [
+        timed('for loop', n, lambda: fact.factorial_for(n)),
+        timed('while loop', n, lambda: fact.factorial_while(n)),
+        timed('product tree', n, lambda: fact.product_range(1, n)),
+        timed('cached, first query', n, lambda: fact.factorial(n)),
+        timed('cached, repeat query', n, lambda: fact.factorial(n)),
+        timed('cached, n+100', n, lambda: fact.factorial(n + 100) // math.prod(range(n + 1, n + 101))),
+    ]
+    assert all(value == expected for value in results), 'factorials disagree'
+    small = min(n, 900)  # the recursive version stops near the recursion limit
+    timed('recursive', small, lambda: fact.factorial_recursive(small))
+
+    rng = random.Random(42)
+    queries = [rng.randrange(n // 2, n) for _ in range(20)]
+    fact._cache.clear()
+    batch = timed('batch of 20', n, lambda: fact.factorials(queries))
+    single = timed('20 product trees', n, lambda: [fact.product_range(1, q) for q in queries])
+    assert batch == single, 'batch disagrees'
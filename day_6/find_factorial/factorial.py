@@ -1,21 +1,156 @@
-#5=5*4*3*2*1 
-n=int(input('factorial number'))
-value=1
-if n<=0:
-    print('invalid')
-for i in range(n,0,-1):
-    value*=i 
-print(value)
-
-value=1
-while(n>0):
-    value*=n
-    n-=1
-print(value)
+#5=5*4*3*2*1
+import bisect
+from collections import OrderedDict
+
+LEAF_SIZE = 32  # consecutive integers multiplied in a plain loop at the tree leaves
+CACHE_ENTRIES = 256  # factorials kept by the cache
+CACHE_BITS = 64 * 1024 * 1024 * 8  # and their total size, 64 MB
+
+
+def product_range(lo, hi):
+    """lo*(lo+1)*...*hi, 1 when hi < lo
+    multiplies as a balanced product tree so big ints are combined with
+    numbers of similar size instead of one small factor at a time"""
+    if hi < lo:
+        return 1
+    level = []
+    for start in range(lo, hi + 1, LEAF_SIZE):
+        value = 1
+        for i in range(start, min(start + LEAF_SIZE, hi + 1)):
+            value *= i
+        level.append(value)
+    while len(level) > 1:
+        paired = [level[i] * level[i + 1] for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
+class factorial_cache:
+    """bounded memo of computed factorials that doubles as a set of checkpoints:
+    n! is computed from the largest cached m! <= n as m! * product_range(m+1, n)"""
+    def __init__(self, max_entries=CACHE_ENTRIES, max_bits=CACHE_BITS):
+        self.max_entries = max_entries
+        self.max_bits = max_bits
+        self._values = OrderedDict()  # n -> n!, least recently used first
+        self._keys = []  # cached n, sorted for the checkpoint lookup
+        self._bits = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, n):
+        return n in self._values
+
+    def clear(self):
+        self._values.clear()
+        self._keys.clear()
+        self._bits = 0
+
+    def _checkpoint(self, n):
+        """(m, m!) for the largest cached m <= n, or (0, 1)"""
+        i = bisect.bisect_right(self._keys, n)
+        if not i:
+            return 0, 1
+        m = self._keys[i - 1]
+        self._values.move_to_end(m)
+        return m, self._values[m]
+
+    def _store(self, n, value):
+        if n in self._values:
+            return
+        size = value.bit_length()
+        if size > self.max_bits:
+            return
+        self._values[n] = value
+        bisect.insort(self._keys, n)
+        self._bits += size
+        while len(self._values) > self.max_entries or self._bits > self.max_bits:
+            old, old_value = self._values.popitem(last=False)
+            del self._keys[bisect.bisect_left(self._keys, old)]
+            self._bits -= old_value.bit_length()
+
+    def factorial(self, n):
+        if n < 0:
+            raise ValueError("factorial not defined for negative values")
+        if n in self._values:
+            self.hits += 1
+            self._values.move_to_end(n)
+            return self._values[n]
+        self.misses += 1
+        m, value = self._checkpoint(n)
+        value *= product_range(m + 1, n)
+        self._store(n, value)
+        return value
+
+    def factorials(self, values):
+        """n! for every n in values, in the same order
+        distinct n are computed in increasing order, each from the previous one"""
+        values = list(values)
+        if any(n < 0 for n in values):
+            raise ValueError("factorial not defined for negative values")
+        results = {}
+        previous, value = 0, 1
+        for n in sorted(set(values)):
+            if n in self._values:
+                self.hits += 1
+                self._values.move_to_end(n)
+                value = self._values[n]
+            else:
+                self.misses += 1
+                m, checkpoint = self._checkpoint(n)
+                if m > previous:
+                    previous, value = m, checkpoint
+                value *= product_range(previous + 1, n)
+                self._store(n, value)
+            previous = n
+            results[n] = value
+        return [results[n] for n in values]
+
+
+_cache = factorial_cache()
+
+
 def factorial(n):
+    """n! using the product tree and the shared cache (no recursion limit)"""
+    return _cache.factorial(n)
+
+
+def factorials(values):
+    """factorial() for many n at once"""
+    return _cache.factorials(values)
+
+
+def factorial_for(n):
+    value=1
+    for i in range(n,0,-1):
+        value*=i
+    return value
+
+
+def factorial_while(n):
+    value=1
+    while(n>0):
+        value*=n
+        n-=1
+    return value
+
+
+def factorial_recursive(n):
     if(n==0 or n==1):
         return 1
     else:
-        return n*factorial(n-1)
-result=factorial(5)
-print(result)
+        return n*factorial_recursive(n-1)
+
+
+if __name__ == '__main__':
+    n=int(input('factorial number'))
+    if n<=0:
+        print('invalid')
+    print(factorial_for(n))
+    print(factorial_while(n))
+    result=factorial(5)
+    print(result)
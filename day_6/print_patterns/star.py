@@ -1,4 +1,5 @@
 #type 1
+import sys
 n =int(input('enter dimension'))
-for i in range(1,n+1):
-    print(' ' * (n-i) +'* ' * i)
+#build every row first and write the whole pattern at once
+sys.stdout.write(''.join(' ' * (n-i) +'* ' * i + '\n' for i in range(1,n+1)))
@@ -1,4 +1,13 @@
+import array
+import math
+from operator import add, sub, mul, truediv
+try:
+    import numpy as np
+except ImportError:  # batch mode falls back to plain Python loops
+    np = None
+
 class calculator:
+    operations={'add':add,'subtract':sub,'multiply':mul,'divide':truediv}
     @staticmethod
     def fn_calculator(value1:int,operator:str,value2:int):
         """ 
@@ -26,8 +35,53 @@ class calculator:
             return result
         else:
             return 'invalid operator'
+    @staticmethod
+    def numpy_column(column):
+        """
+        operand column as a numpy array
+        array.array shares its buffer, but 8, 16 and 32 bit items are first
+        widened to int64 or float64 so they give the same results as the
+        plain Python loop instead of overflowing
+        """
+        if not isinstance(column,array.array):
+            return np.asarray(column)
+        column=np.frombuffer(column,dtype=column.typecode)
+        if column.dtype.itemsize<8:
+            column=column.astype(np.float64 if column.dtype.kind=='f' else np.int64)
+        return column
+    @staticmethod
+    def batch_calculator(values1,operator:str,values2):
+        """
+        calculating two columns of operands element by element
+        Args:
+        values1:operands1:list, array.array or numpy array
+        operator: add,subtract,multiply,divide:str
+        values2:operands2:same length as values1
+
+        Result:
+        list of results (numpy array for numpy or array.array input when numpy is installed),
+        nan where dividing by zero
+        """
+        if operator not in calculator.operations:
+            return 'invalid operator'
+        if len(values1)!=len(values2):
+            raise ValueError('operand columns have different lengths')
+        function=calculator.operations[operator]
+        columns=(values1,values2)
+        if np is not None and any(isinstance(column,(np.ndarray,array.array)) for column in columns):
+            values1,values2=map(calculator.numpy_column,columns)
+            with np.errstate(divide='ignore',invalid='ignore'):
+                result=function(values1,values2)
+            if operator=='divide':
+                result[values2==0]=np.nan
+            return result
+        if operator=='divide':
+            return [value1/value2 if value2 else math.nan for value1,value2 in zip(values1,values2)]
+        return list(map(function,values1,values2))
+
+if __name__ == '__main__':
     input1=int(input('first value :\n'))
     operator=input('operator:add,subtract,multiply,divide : \n')
     input2=int(input('second value :\n'))
-    value=fn_calculator(input1,operator,input2)
+    value=calculator.fn_calculator(input1,operator,input2)
     print(value)
@@ -0,0 +1,48 @@
+"""Compare one-at-a-time conversion with convert_batch and convert_csv.
+
+usage: python benchmark.py [readings]   (default 1000000)
+"""
+import array
+import os
+import random
+import sys
+import tempfile
+import time
+
+import temp
+from temp import convertor
+
+
+def timed(label, size, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f'{label:20}: {elapsed:7.3f}s  ({size / elapsed / 1e6:7.2f} M readings/s)')
+    return result
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rng = random.Random(42)
+    readings = [rng.uniform(-40.0, 120.0) for _ in range(size)]
+    column = array.array('d', readings)
+
+    expected = timed('one at a time', size,
+                     lambda: [convertor.temperature_convertor(value, 'F', 'C') for value in readings])
+    results = [timed('batch list', size, lambda: convertor.convert_batch(readings, 'F', 'C'))]
+    if temp.np is not None:
+        array_ = temp.np.array(readings)
+        results.append(timed('batch numpy', size, lambda: convertor.convert_batch(array_, 'F', 'C').tolist()))
+        results.append(timed('batch array.array', size, lambda: convertor.convert_batch(column, 'F', 'C').tolist()))
+    numpy, temp.np = temp.np, None
+    results.append(timed('array.array loop', size, lambda: convertor.convert_batch(column, 'F', 'C').tolist()))
+    temp.np = numpy
+    assert all(result == expected for result in results), 'conversions disagree'
+
+    with tempfile.TemporaryDirectory() as directory:
+        source, target = os.path.join(directory, 'in.csv'), os.path.join(directory, 'out.csv')
+        with open(source, 'w', newline='') as file:
+            file.write('sensor,reading\n')
+            file.writelines(f'{i % 100},{value!r}\n' for i, value in enumerate(readings))
+        with open(source, newline='') as fileinput, open(target, 'w', newline='') as fileoutput:
+            timed('csv column', size, lambda: convertor.convert_csv(fileinput, fileoutput, 'reading', 'F', 'C'))
@@ -1,20 +1,117 @@
+import array
+import csv
+from itertools import islice
+try:
+    import numpy as np
+except ImportError:  # batch conversion falls back to a plain Python loop
+    np = None
+
+# every unit goes to Celsius as (value + shift) * numerator / denominator ...
+TO_CELSIUS = {'C': (0, 1, 1), 'F': (-32, 5, 9), 'K': (-273.15, 1, 1)}
+# ... and from Celsius as value * numerator / denominator + offset
+FROM_CELSIUS = {'C': (1, 1, 0), 'F': (9, 5, 32), 'K': (1, 1, 273.15)}
+
+
+def _transform(unit1, unit2):
+    if unit1 == unit2:
+        return 0, 1, 1, 0
+    shift, numerator, denominator = TO_CELSIUS[unit1]
+    numerator2, denominator2, offset = FROM_CELSIUS[unit2]
+    return shift, numerator * numerator2, denominator * denominator2, offset
+
+
+# (shift, numerator, denominator, offset) for every unit pair:
+# result = (value + shift) * numerator / denominator + offset, the scale is
+# kept as a fraction so (t - 32) * 5 / 9 rounds exactly as the formula does
+TRANSFORMS = {(unit1, unit2): _transform(unit1, unit2) for unit1 in TO_CELSIUS for unit2 in TO_CELSIUS}
+BATCH_ROWS = 100000  # CSV rows converted per batch
+
+
 class convertor:
     @staticmethod
     def temperature_convertor(temperature:int,unit1:str,unit2:str):
-        """ 
+        """
         convert given temperature from unit 1 to unit 2
         Args:
         -temperature:int:value of temperature
-        -unit1:str:current unit of temperature
-        -unit2:str:to be converted in this unit
+        -unit1:str:current unit of temperature (C, F or K)
+        -unit2:str:to be converted in this unit (C, F or K)
         Result:
         -temperature provided in converted unit
         """
-        if(unit1=='F' and unit2=='C'):
-            value=(temperature-32)*5/9
-            return value
-        elif(unit1=='C' and unit2=='F'):
-            value=temperature+273.15
-            return value
-        else:
+        if (unit1,unit2) not in TRANSFORMS:
             return 'wrong unit'
+        shift,numerator,denominator,offset=TRANSFORMS[unit1,unit2]
+        return (temperature+shift)*numerator/denominator+offset
+
+    @staticmethod
+    def convert_batch(temperatures,unit1:str,unit2:str):
+        """
+        convert a whole sequence of temperatures from unit 1 to unit 2
+        Args:
+        -temperatures:list, array.array or NumPy array of values
+        -unit1:str:current unit (C, F or K)
+        -unit2:str:to be converted in this unit
+        Result:
+        -NumPy float64 array for NumPy arrays (and array.array when NumPy is
+         installed), array.array('d') for array.array without NumPy, else a list
+        """
+        if (unit1,unit2) not in TRANSFORMS:
+            raise ValueError("wrong unit")
+        shift,numerator,denominator,offset=TRANSFORMS[unit1,unit2]
+        if np is not None and isinstance(temperatures,(np.ndarray,array.array)):
+            if isinstance(temperatures,array.array):
+                temperatures=np.frombuffer(temperatures,dtype=temperatures.typecode)  # no copy
+            result=np.add(temperatures,shift,dtype=np.float64)
+            if numerator!=denominator:
+                result*=numerator
+                result/=denominator
+            if offset:
+                result+=offset
+            return result
+        values=[(value+shift)*numerator/denominator+offset for value in temperatures]
+        if isinstance(temperatures,array.array):
+            return array.array('d',values)
+        return values
+
+    @staticmethod
+    def convert_csv(fileinput,fileoutput,column,unit1:str,unit2:str,header=True,batch_rows=BATCH_ROWS):
+        """
+        stream a CSV from fileinput to fileoutput, converting one column
+        Args:
+        -fileinput, fileoutput: open text files (newline='')
+        -column: index of the column, or its name when header is True
+        -unit1, unit2: as in convert_batch
+        Result:
+        -number of data rows written; blank, missing or non-numeric cells
+         are copied through unchanged
+        """
+        if (unit1,unit2) not in TRANSFORMS:
+            raise ValueError("wrong unit")
+        reader=csv.reader(fileinput)
+        writer=csv.writer(fileoutput)
+        if header:
+            names=next(reader,None)
+            if names is None:
+                return 0
+            writer.writerow(names)
+            if not isinstance(column,int):
+                column=names.index(column)
+        count=0
+        while True:
+            rows=list(islice(reader,batch_rows))
+            if not rows:
+                return count
+            filled=[]
+            values=array.array('d')
+            for i,row in enumerate(rows):
+                if len(row)>column:
+                    try:
+                        values.append(float(row[column]))
+                    except ValueError:
+                        continue  # blank or not a number
+                    filled.append(i)
+            for i,value in zip(filled,convertor.convert_batch(values,unit1,unit2).tolist()):
+                rows[i][column]=value  # the csv writer formats floats with repr()
+            writer.writerows(rows)
+            count+=len(rows)
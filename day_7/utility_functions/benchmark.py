@@ -0,0 +1,72 @@
+"""Compare per-cell print() against the buffered line renderers, and time
+the tiled table writers.
+
+usage: python benchmark.py [size]   (default 5000, i.e. a 5000x5000 table)
+"""
+import contextlib
+import os
+import sys
+import tempfile
+import time
+
+from functions import Patterns, numbers
+
+
+def old_multiplication(user_input1, user_input2, ranges):
+    """The previous numbers.multiplication: one print() call per cell."""
+    print("     ", end='')
+    for i in range(1, ranges+1):
+        print(f"{i:2}", end=' ')
+    print()
+    print('     '+('--- '*(ranges+1)))
+    for j in range(user_input1, user_input2+1):
+        print(f'{j:2} | ', end='')
+        for i in range(1, ranges+1):
+            print(''+f"{i*j:2}", end=' ')
+        print()
+
+
+def old_inv_ryt_triangle(user_input):
+    """The previous Patterns.inv_ryt_triangle: one print() call per digit."""
+    for i in range(user_input, 0, -1):
+        for j in range(i, 0, -1):
+            print(j, end='')
+        print()
+
+
+def timed(label, path, func):
+    start = time.perf_counter()
+    with open(path, 'w') as file, contextlib.redirect_stdout(file):
+        func(file)
+    elapsed = time.perf_counter() - start
+    size_mb = os.path.getsize(path) / 1024 / 1024
+    print(f'{label:23}: {elapsed:7.2f}s  ({size_mb / elapsed:7.1f} MB/s)')
+
+
+def same(path1, path2):
+    with open(path1) as file1, open(path2) as file2:
+        return file1.read() == file2.read()
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    with tempfile.TemporaryDirectory() as directory:
+        old, new = os.path.join(directory, 'old.txt'), os.path.join(directory, 'new.txt')
+        timed('table print per cell', old, lambda file: old_multiplication(1, size, size))
+        timed('table buffered', new, lambda file: numbers.multiplication(1, size, size, file))
+        assert same(old, new), 'tables differ'
+        triangle = min(size, 2000)  # the triangle grows with size squared
+        timed('triangle print per cell', old, lambda file: old_inv_ryt_triangle(triangle))
+        timed('triangle buffered', new, lambda file: Patterns.inv_ryt_triangle(triangle, file))
+        assert same(old, new), 'triangles differ'
+        start = time.perf_counter()
+        binary = os.path.join(directory, 'table.bin')
+        numbers.save_binary(1, size, size, binary)
+        elapsed = time.perf_counter() - start
+        print(f'{"table to binary":23}: {elapsed:7.2f}s  ({size * size / elapsed / 1e6:7.1f} M cells/s)')
+        row = size // 2
+        assert list(numbers.load_binary(binary, size)[row][:3]) == [row + 1, 2 * (row + 1), 3 * (row + 1)]
+        start = time.perf_counter()
+        numbers.save_csv(1, size, size, os.path.join(directory, 'table.csv'))
+        elapsed = time.perf_counter() - start
+        print(f'{"table to csv":23}: {elapsed:7.2f}s  ({size * size / elapsed / 1e6:7.1f} M cells/s)')
@@ -1,30 +1,182 @@
+import array
+import mmap
+import os
+import sys
+try:
+    import numpy as np
+except ImportError:  # tables are built from array.array rows instead
+    np = None
+
+BLOCK_SIZE = 1024 * 1024  # characters collected before each write
+TILE_CELLS = 1024 * 1024  # table cells computed per tile
+TYPECODE = 'q'  # 64-bit signed cells, same layout as NumPy int64
+
+
+def write_lines(lines, file=None):
+    """Write lines (without newlines) to file in large blocks instead of per cell."""
+    file = sys.stdout if file is None else file
+    block = []
+    size = 0
+    for line in lines:
+        block.append(line)
+        size += len(line) + 1
+        if size >= BLOCK_SIZE:
+            file.write('\n'.join(block) + '\n')
+            block = []
+            size = 0
+    if block:
+        file.write('\n'.join(block) + '\n')
+
+
+def render(lines):
+    """Join generated lines into one string, as it would be printed."""
+    return ''.join(line + '\n' for line in lines)
+
+
 class Patterns:
     @staticmethod
-    def pyramid(user_input):
+    def pyramid_lines(user_input):
         for i in range(1,user_input+1):
-            print(' '*(user_input-i) + "* "*i)
+            yield ' '*(user_input-i) + "* "*i
     @staticmethod
-    def inv_ryt_triangle(user_input):
+    def inv_ryt_triangle_lines(user_input):
         for i in range(user_input,0,-1):#numbers in one line
-            for j in range(i,0,-1):#gets the values in each line
-                print(j,end='')
-            print()
+            yield ''.join(map(str,range(i,0,-1)))#gets the values in each line
     @staticmethod
-    def ryt_triangle(user_input):
+    def ryt_triangle_lines(user_input):
         for i in range(1,user_input+1):
-            for j in range(1,i+1):
-                print(i,end='')
-            print()
+            yield str(i)*i
+    @staticmethod
+    def pyramid_text(user_input):
+        return render(Patterns.pyramid_lines(user_input))
+    @staticmethod
+    def inv_ryt_triangle_text(user_input):
+        return render(Patterns.inv_ryt_triangle_lines(user_input))
+    @staticmethod
+    def ryt_triangle_text(user_input):
+        return render(Patterns.ryt_triangle_lines(user_input))
+    @staticmethod
+    def pyramid(user_input,file=None):
+        write_lines(Patterns.pyramid_lines(user_input),file)
+    @staticmethod
+    def inv_ryt_triangle(user_input,file=None):
+        write_lines(Patterns.inv_ryt_triangle_lines(user_input),file)
+    @staticmethod
+    def ryt_triangle(user_input,file=None):
+        write_lines(Patterns.ryt_triangle_lines(user_input),file)
 class numbers:
     @staticmethod
-    def multiplication(user_input1,user_input2,ranges):
-        print("     ", end='')
-        for i in range(1,ranges+1):
-            print(f"{i:2}",end=' ')
-        print()
-        print('     '+('--- '*(ranges+1)))
+    def multiplication_lines(user_input1,user_input2,ranges):
+        cell='{:2} '*ranges#one format string renders a whole row at once
+        yield "     " + cell.format(*range(1,ranges+1))
+        yield '     '+('--- '*(ranges+1))
         for j in range(user_input1,user_input2+1):
-            print(f'{j:2} | ',end='')
-            for i in range(1,ranges+1):
-                print(''+f"{i*j:2}", end=' ')
-            print()
+            products=range(j,j*(ranges+1),j) if j else [0]*ranges#j*1 ... j*ranges
+            yield f'{j:2} | ' + cell.format(*products)
+    @staticmethod
+    def multiplication_text(user_input1,user_input2,ranges):
+        return render(numbers.multiplication_lines(user_input1,user_input2,ranges))
+    @staticmethod
+    def multiplication(user_input1,user_input2,ranges,file=None):
+        write_lines(numbers.multiplication_lines(user_input1,user_input2,ranges),file)
+    @staticmethod
+    def table(multipliers,columns):
+        """outer product of two integer ranges: cell [r][c] is multipliers[r]*columns[c]
+        returns a 2D int64 NumPy array, or a list of array.array rows without NumPy"""
+        if np is not None:
+            return np.multiply.outer(np.array(multipliers,dtype=np.int64),np.array(columns,dtype=np.int64))
+        return [array.array(TYPECODE,[i*j for j in columns]) for i in multipliers]
+    @staticmethod
+    def table_slice(user_input1,user_input2,ranges,rows=slice(None),columns=slice(None)):
+        """the rows/columns (slices or indexes) of the full table, computing only those cells
+        numbers.table_slice(1,10**9,10**9,slice(5,7),slice(0,3)) touches 6 cells"""
+        multipliers=range(user_input1,user_input2+1)[rows]
+        values=range(1,ranges+1)[columns]
+        if isinstance(multipliers,int):
+            multipliers=[multipliers]
+        if isinstance(values,int):
+            values=[values]
+        return numbers.table(multipliers,values)
+    @staticmethod
+    def tiles(user_input1,user_input2,ranges,tile_cells=TILE_CELLS):
+        """yield (first_multiplier, first_column, block) covering the table in row-major order
+        a tile holds at most tile_cells cells: several whole rows, or part of one wide row"""
+        width=max(1,min(ranges,tile_cells))
+        step=max(1,tile_cells//width)
+        for start in range(user_input1,user_input2+1,step):
+            multipliers=range(start,min(start+step,user_input2+1))
+            for first in range(1,ranges+1,width):
+                yield start,first,numbers.table(multipliers,range(first,min(first+width,ranges+1)))
+    @staticmethod
+    def save_binary(user_input1,user_input2,ranges,path,tile_cells=TILE_CELLS):
+        """write the table as raw row-major int64 cells, tile by tile
+        read it back lazily with numbers.load_binary()"""
+        with open(path,'wb') as file:
+            for _,_,block in numbers.tiles(user_input1,user_input2,ranges,tile_cells):
+                # tiles come in file order, so each one is appended
+                if np is not None:
+                    block.tofile(file)
+                else:
+                    for row in block:
+                        row.tofile(file)
+    @staticmethod
+    def load_binary(path,ranges):
+        """memory-map a table written by save_binary(); rows are only read when indexed
+        returns an (rows, ranges) np.memmap, or a binary_table indexed by row, row slice or (row, column)"""
+        if np is not None:
+            if not os.path.getsize(path):
+                return np.empty((0,ranges),dtype=np.int64)  # an empty file cannot be mapped
+            return np.memmap(path,dtype=np.int64,mode='r').reshape(-1,ranges)
+        return binary_table(path,ranges)
+    @staticmethod
+    def save_csv(user_input1,user_input2,ranges,path,header=True,tile_cells=TILE_CELLS):
+        """write the table as CSV (multiplier first, then its products), tile by tile"""
+        with open(path,'w',buffering=BLOCK_SIZE) as file:
+            if header:
+                file.write('x')
+                for first in range(1,ranges+1,max(1,tile_cells)):
+                    file.write(','+','.join(map(str,range(first,min(first+tile_cells,ranges+1)))))
+                file.write('\n')
+            for start,first,block in numbers.tiles(user_input1,user_input2,ranges,tile_cells):
+                rows=block.tolist() if np is not None else block
+                if len(rows[0])==ranges:
+                    write_lines((','.join(map(str,[i,*row])) for i,row in enumerate(rows,start)),file)
+                else:
+                    # part of one wide row: start the line, or carry on after the previous part
+                    file.write((str(start) if first==1 else '')+','+','.join(map(str,rows[0])))
+                    if first+len(rows[0])>ranges:
+                        file.write('\n')
+
+
+class binary_table:
+    """row access to a table written by numbers.save_binary() without NumPy:
+    the file is memory-mapped and table[row] is a memoryview of int64 cells,
+    so only the rows that are read are loaded; a row slice gives a list of rows"""
+    def __init__(self,path,ranges):
+        self.ranges=ranges
+        with open(path,'rb') as file:
+            size=os.fstat(file.fileno()).st_size
+            self._map=mmap.mmap(file.fileno(),0,access=mmap.ACCESS_READ) if size else None
+        self._cells=memoryview(self._map).cast(TYPECODE) if size else memoryview(array.array(TYPECODE))
+        self.rows=len(self._cells)//ranges if ranges else 0
+    def __len__(self):
+        return self.rows
+    def __getitem__(self,row):
+        if isinstance(row,tuple):
+            row,column=row
+            if isinstance(row,slice):
+                return [cells[column] for cells in self[row]]
+            return self[row][column]
+        if isinstance(row,slice):
+            return [self[i] for i in range(*row.indices(self.rows))]
+        if row<0:
+            row+=self.rows
+        if not 0<=row<self.rows:
+            raise IndexError('table row out of range')
+        return self._cells[row*self.ranges:(row+1)*self.ranges]
+    def __iter__(self):
+        return (self[row] for row in range(self.rows))
+    def close(self):
+        self._cells.release()
+        if self._map is not None:
+            self._map.close()
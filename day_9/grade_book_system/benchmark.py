@@ -0,0 +1,57 @@
+"""Time Student.register_csv / register_batch, grade_store.averages() and
+leaderboard queries.
+
+usage: python benchmark.py [rows]   (default 1,000,000)
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from grade_book import GRADE_POINTS, Student, grade_store
+
+SUBJECTS = [f'subject{i}' for i in range(40)]
+
+
+def make_rows(path, rows):
+    """Write a csv of students with 3-8 subjects each; half come without grades."""
+    rng = random.Random(11)
+    grades = list(GRADE_POINTS)
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('student,subjects,grades\n')
+        for i in range(rows):
+            subjects = rng.sample(SUBJECTS, rng.randint(3, 8))
+            marks = ','.join(rng.choice(grades) for _ in subjects) if i % 2 else ''
+            file.write(f'student{i},"{",".join(subjects)}","{marks}"\n')
+
+
+def timed(label, rows, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f'{label:16}: {elapsed:6.2f}s  {rows / elapsed:12,.0f} rows/sec')
+    return result
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'intake.csv')
+        make_rows(path, rows)
+        store = grade_store()
+        print(timed('register store', rows, lambda: Student.register_csv(store, path)))
+        print(timed('register dict', rows, lambda: Student.register_csv({}, path)))
+        timed('averages', rows, store.averages)
+        timed('ranking build', rows, lambda: store.top_students(10))
+
+        # after the first build each query only fixes up the changed student
+        queries, grades = 1000, list(GRADE_POINTS)
+        start = time.perf_counter()
+        for i in range(queries):
+            student = f'student{i * 7 % rows}'
+            store[student]['subject0'] = grades[i % len(grades)]
+            store.top_students(10)
+            store.percentile(student)
+        elapsed = time.perf_counter() - start
+        print(f'update + top10 + percentile: {elapsed / queries * 1e6:8.1f} us per query')
@@ -1,3 +1,483 @@
+from bisect import bisect_left, insort
+from collections.abc import MutableMapping
+from itertools import chain as _chain, compress
+from math import inf, nextafter
+import csv
+try:
+    import numpy as np
+except ImportError:  # averages fall back to plain Python loops
+    np = None
+
+# Grade to marks mapping - cleaner than if-elif chains
+GRADE_POINTS = {
+    'A+': 100, 'A': 90, 'B+': 85, 'B': 80,
+    'C+': 75, 'C': 70, 'D+': 65, 'D': 60,
+    'E': 50, 'F': 0
+}
+MISSING = 0  # grade code of a subject the student does not take
+DEFAULT_GRADE = 'D'  # grade given to newly registered subjects
+
+
+class student_grades(MutableMapping):
+    """Dict-like view of one student's row in a grade_store"""
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, subject):
+        code = self._store._get_code(self._row, subject)
+        if code == MISSING:
+            raise KeyError(subject)
+        return self._store._grades[code]
+
+    def __setitem__(self, subject, grade):
+        self._store._set_code(self._row, subject, self._store._grade_code(grade))
+
+    def __delitem__(self, subject):
+        if self._store._get_code(self._row, subject) == MISSING:
+            raise KeyError(subject)
+        self._store._set_code(self._row, subject, MISSING)
+
+    def __iter__(self):
+        store = self._store
+        base = self._row * store._stride
+        row = store._codes[base:base + len(store._subject_names)]
+        return iter([store._subject_names[column] for column, code in enumerate(row) if code != MISSING])
+
+    def __len__(self):
+        store = self._store
+        base = self._row * store._stride
+        row = store._codes[base:base + len(store._subject_names)]
+        return len(row) - row.count(MISSING)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class grade_store(MutableMapping):
+    """
+    Columnar grade book: behaves like dict[str, dict[str, str]] for the
+    Student menu, but students and subjects are interned to integer ids and
+    grades are kept as one byte per cell in a row-major matrix (0 = missing),
+    so averages are computed in one vectorized pass. A subject -> rows
+    index lets subject-wide queries and removals touch only the students
+    who take that subject, and running per-student sums plus lazily
+    maintained rankings answer leaderboard and percentile queries without
+    rescanning the cohort.
+    """
+    def __init__(self, records=None):
+        self._rows = {}            # student -> row id
+        self._free_rows = []       # rows of removed students, already zeroed
+        self._row_count = 0
+        self._row_names = []       # row id -> student, None for a free row
+        self._subjects = {}        # subject -> column id
+        self._subject_names = []
+        self._takers = []          # column id -> set of row ids with a grade
+        self._untaken = {}         # column id -> [(first, last)] bulk-loaded rows not in _takers yet
+        self._stride = 8           # allocated columns per row
+        self._codes = bytearray()  # row-major grade codes
+        self._grade_codes = {}     # grade -> code
+        self._grades = [None]      # code -> grade
+        self._points = [None]      # code -> GRADE_POINTS value, None if not a valid grade
+        # running aggregates, kept up to date on every grade change
+        self._row_sums = []        # row id -> sum of valid points
+        self._row_counts = []      # row id -> number of valid grades
+        self._histograms = []      # column id -> {code: students}
+        # rankings are sorted lists of (-points, student) fixed up lazily
+        # from the rows that changed since the last ranking query
+        self._ranking, self._ranked, self._dirty = [], {}, set()
+        self._subject_rankings, self._subject_ranked, self._subject_dirty = [], [], []
+        self._rebuild = set()      # rankings to re-sort from scratch: None (overall) or column ids
+        if records:
+            self.update(records)
+
+    def _grade_code(self, grade):
+        code = self._grade_codes.get(grade)
+        if code is None:
+            if len(self._grades) > 255:
+                raise ValueError('too many distinct grades')
+            code = self._grade_codes[grade] = len(self._grades)
+            self._grades.append(grade)
+            self._points.append(GRADE_POINTS.get(grade))
+        return code
+
+    def _column(self, subject):
+        column = self._subjects.get(subject)
+        if column is None:
+            column = self._subjects[subject] = len(self._subject_names)
+            self._subject_names.append(subject)
+            self._takers.append(set())
+            self._histograms.append({})
+            self._subject_rankings.append([])
+            self._subject_ranked.append({})
+            self._subject_dirty.append(set())
+            if column >= self._stride:
+                self._widen(self._stride * 2)
+        return column
+
+    def _widen(self, stride):
+        """re-layout the matrix with more columns per row"""
+        old, old_stride = self._codes, self._stride
+        codes = bytearray(self._row_count * stride)
+        for row in range(self._row_count):
+            codes[row * stride:row * stride + old_stride] = old[row * old_stride:(row + 1) * old_stride]
+        self._codes, self._stride = codes, stride
+
+    def _get_code(self, row, subject):
+        column = self._subjects.get(subject)
+        if column is None:
+            return MISSING
+        return self._codes[row * self._stride + column]
+
+    def _write(self, row, column, code):
+        """store one grade code and update the subject index and aggregates"""
+        index = row * self._stride + column
+        old = self._codes[index]
+        if old == code:
+            return
+        self._codes[index] = code
+        histogram = self._histograms[column]
+        if old != MISSING:
+            histogram[old] -= 1
+            point = self._points[old]
+            if point is not None:
+                self._row_sums[row] -= point
+                self._row_counts[row] -= 1
+        takers = self._column_takers(column) if self._untaken else self._takers[column]
+        if code == MISSING:
+            takers.discard(row)
+        else:
+            takers.add(row)
+            histogram[code] = histogram.get(code, 0) + 1
+            point = self._points[code]
+            if point is not None:
+                self._row_sums[row] += point
+                self._row_counts[row] += 1
+        self._dirty.add(row)
+        self._subject_dirty[column].add(row)
+
+    def _column_takers(self, column):
+        """the subject index of a column, first adding the rows of bulk loads"""
+        takers = self._takers[column]
+        for first, last in self._untaken.pop(column, ()):
+            stride = self._stride
+            takers.update(compress(range(first, last), self._codes[first * stride + column:last * stride:stride]))
+        return takers
+
+    def _set_code(self, row, subject, code):
+        if code == MISSING and subject not in self._subjects:
+            return
+        self._write(row, self._column(subject), code)
+
+    def _clear_row(self, row):
+        base = row * self._stride
+        for column, code in enumerate(self._codes[base:base + len(self._subject_names)]):
+            if code != MISSING:
+                self._write(row, column, MISSING)
+
+    def __getitem__(self, student):
+        return student_grades(self, self._rows[student])
+
+    def __setitem__(self, student, subject_grades):
+        subject_grades = dict(subject_grades)  # may be this student's own view
+        row = self._rows.get(student)
+        if row is None:
+            if self._free_rows:
+                row = self._free_rows.pop()
+                self._row_names[row] = student
+            else:
+                row = self._row_count
+                self._row_count += 1
+                self._row_names.append(student)
+                self._row_sums.append(0)
+                self._row_counts.append(0)
+                self._codes.extend(bytes(self._stride))
+            self._rows[student] = row
+            self._dirty.add(row)
+        else:
+            self._clear_row(row)
+        subjects, grade_codes = self._subjects, self._grade_codes
+        for subject, grade in subject_grades.items():
+            column = subjects.get(subject)
+            if column is None:
+                column = self._column(subject)
+            self._write(row, column, grade_codes.get(grade) or self._grade_code(grade))
+
+    def update(self, other=(), **kwargs):
+        """
+        dict.update() with a bulk path for students not in the store yet:
+        their codes and running sums are written directly, the subject index
+        and histograms are updated once per subject, and the rankings are
+        left to be rebuilt on the next query
+        """
+        items = other.items() if hasattr(other, 'items') else other
+        new = {}
+        for student, subject_grades in _chain(items, kwargs.items()):
+            if student in self._rows:
+                self[student] = subject_grades
+            else:
+                new[student] = subject_grades
+        if new:
+            self._load(new)
+
+    def _load(self, records):
+        """append records of new students as one block of rows, then derive
+        the running sums, subject index and histograms from the block and
+        leave the rankings to be re-sorted on the next query"""
+        students = list(records)
+        grades = [subject_grades if type(subject_grades) is dict else dict(subject_grades)
+                  for subject_grades in records.values()]
+        reused = min(len(self._free_rows), len(students))
+        for student, subject_grades in zip(students[:reused], grades):
+            self[student] = subject_grades  # reuse the rows of removed students
+        del students[:reused], grades[:reused]
+        if not students:
+            return
+        # intern new subjects and grades first, so the matrix is widened while
+        # it is small and the loop below is plain dict lookups
+        for subject in set().union(*grades):
+            if subject not in self._subjects:
+                self._column(subject)
+        for grade in set(_chain.from_iterable(map(dict.values, grades))):
+            self._grade_code(grade)
+        first = self._row_count
+        self._row_count += len(students)
+        self._codes.extend(bytes(self._stride * len(students)))
+        self._row_names.extend(students)
+        self._rows.update(zip(students, range(first, self._row_count)))
+        subjects, grade_codes, codes, stride = self._subjects, self._grade_codes, self._codes, self._stride
+        if np is not None:
+            # scatter every (row, column) -> code of the block in one assignment
+            cells = list(map(len, grades))
+            matrix = np.frombuffer(codes, dtype=np.uint8).reshape(-1, stride)
+            matrix[np.repeat(np.arange(first, self._row_count), cells),
+                   np.fromiter(map(subjects.__getitem__, _chain.from_iterable(grades)),
+                               dtype=np.intp, count=sum(cells))] = \
+                np.fromiter(map(grade_codes.__getitem__, _chain.from_iterable(map(dict.values, grades))),
+                            dtype=np.uint8, count=sum(cells))
+            del matrix  # release the buffer so the bytearray can grow again
+        else:
+            for row, subject_grades in enumerate(grades, first):
+                base = row * stride
+                for subject, grade in subject_grades.items():
+                    codes[base + subjects[subject]] = grade_codes[grade]
+        last = self._row_count
+        # grade code -> points and -> 1 for valid grades, as byte translation tables
+        points = bytes(p or 0 for p in self._points[1:])
+        valid = bytes(p is not None for p in self._points[1:])
+        block = self._codes[first * stride:]
+        values = block.translate(b'\0' + points + bytes(256 - len(self._points)))
+        counts = block.translate(b'\0' + valid + bytes(256 - len(self._points)))
+        if np is not None:
+            self._row_sums.extend(np.frombuffer(values, dtype=np.uint8).reshape(-1, stride).sum(axis=1).tolist())
+            self._row_counts.extend(np.frombuffer(counts, dtype=np.uint8).reshape(-1, stride).sum(axis=1).tolist())
+        else:
+            self._row_sums.extend(sum(values[i:i + stride]) for i in range(0, len(block), stride))
+            self._row_counts.extend(sum(counts[i:i + stride]) for i in range(0, len(block), stride))
+        for column in range(len(self._subject_names)):
+            codes = block[column::stride]
+            if codes.count(MISSING) == len(codes):
+                continue
+            self._untaken.setdefault(column, []).append((first, last))
+            self._rebuild.add(column)
+            histogram = self._histograms[column]
+            for code in range(1, len(self._grades)):
+                students = codes.count(code)
+                if students:
+                    histogram[code] = histogram.get(code, 0) + students
+        self._rebuild.add(None)
+
+    def __delitem__(self, student):
+        row = self._rows.pop(student)
+        self._clear_row(row)
+        self._row_names[row] = None
+        self._dirty.add(row)
+        self._free_rows.append(row)
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, student):
+        return student in self._rows
+
+    def students_taking(self, subject):
+        """names of the students who have a grade for subject"""
+        column = self._subjects.get(subject)
+        if column is None:
+            return []
+        return sorted(self._row_names[row] for row in self._column_takers(column))
+
+    def roster(self, subject):
+        """{student: grade} for every student taking subject"""
+        column = self._subjects.get(subject)
+        if column is None:
+            return {}
+        codes, stride = self._codes, self._stride
+        return {student: self._grades[codes[self._rows[student] * stride + column]]
+                for student in self.students_taking(subject)}
+
+    def remove_subject(self, subject, students=None):
+        """
+        drop subject from every student taking it, or only from students
+        Result:
+        number of grades removed:int
+        """
+        column = self._subjects.get(subject)
+        if column is None:
+            return 0
+        takers = self._column_takers(column)
+        if students is None:
+            rows = list(takers)
+        else:
+            rows = [self._rows[s] for s in students if s in self._rows and self._rows[s] in takers]
+        for row in rows:
+            self._write(row, column, MISSING)
+        return len(rows)
+
+    def student_average(self, student):
+        """average marks of one student from the running sums, None without valid grades"""
+        row = self._rows[student]
+        count = self._row_counts[row]
+        return self._row_sums[row] / count if count else None
+
+    def _student_key(self, row):
+        count = self._row_counts[row]
+        if self._row_names[row] is None or not count:
+            return None
+        return (-self._row_sums[row] / count, self._row_names[row])
+
+    def _refresh(self, ranking, ranked, dirty, rows, key, rebuild=False):
+        """bring a ranking up to date: fix the changed rows one by one, or
+        re-sort everything when too many rows changed since the last query"""
+        if not dirty and not rebuild:
+            return
+        if rebuild or len(dirty) > len(ranking) // 8 + 64:
+            ranked.clear()
+            for row in rows:
+                row_key = key(row)
+                if row_key is not None:
+                    ranked[row] = row_key
+            ranking[:] = sorted(ranked.values())
+        else:
+            for row in dirty:
+                old = ranked.pop(row, None)
+                if old is not None:
+                    del ranking[bisect_left(ranking, old)]
+                new = key(row)
+                if new is not None:
+                    insort(ranking, new)
+                    ranked[row] = new
+        dirty.clear()
+
+    def _student_ranking(self):
+        self._refresh(self._ranking, self._ranked, self._dirty, self._rows.values(), self._student_key,
+                      None in self._rebuild)
+        self._rebuild.discard(None)
+        return self._ranking
+
+    def _subject_ranking(self, column):
+        points, codes, names = self._points, self._codes, self._row_names
+
+        def key(row):
+            point = points[codes[row * self._stride + column]]
+            return None if point is None else (-point, names[row])
+
+        self._refresh(self._subject_rankings[column], self._subject_ranked[column],
+                      self._subject_dirty[column], self._column_takers(column), key, column in self._rebuild)
+        self._rebuild.discard(column)
+        return self._subject_rankings[column]
+
+    def top_students(self, k=10, subject=None):
+        """
+        leaderboard of the k best students, overall or in one subject
+        Result:
+        [(student, average or marks)] best first, ties by name:list
+        """
+        if subject is None:
+            ranking = self._student_ranking()
+        elif subject in self._subjects:
+            ranking = self._subject_ranking(self._subjects[subject])
+        else:
+            return []
+        return [(student, -negated) for negated, student in ranking[:k]]
+
+    def percentile(self, student, subject=None):
+        """share of ranked students (in %) whose average, or marks in subject,
+        are below this student's"""
+        if subject is None:
+            score = self.student_average(student)
+            ranking = None if score is None else self._student_ranking()
+        else:
+            column = self._subjects.get(subject)
+            if column is None:
+                return None
+            score = self._points[self._codes[self._rows[student] * self._stride + column]]
+            ranking = None if score is None else self._subject_ranking(column)
+        if score is None:
+            return None
+        # entries with -score <= -this score are the students at or above it
+        at_or_above = bisect_left(ranking, (nextafter(-score, inf),))
+        return 100 * (len(ranking) - at_or_above) / len(ranking)
+
+    def grade_histogram(self, subject=None):
+        """{grade: number of grades given} overall or for one subject"""
+        if subject is None:
+            columns = self._histograms
+        elif subject in self._subjects:
+            columns = [self._histograms[self._subjects[subject]]]
+        else:
+            return {}
+        totals = {}
+        for histogram in columns:
+            for code, count in histogram.items():
+                if count:
+                    totals[code] = totals.get(code, 0) + count
+        return {self._grades[code]: totals[code] for code in sorted(totals)}
+
+    def averages(self):
+        """
+        per-student, per-subject and whole-cohort average marks in one pass
+        grades outside GRADE_POINTS are left out of every average
+        Result:
+        {'students': {name: avg}, 'subjects': {subject: avg}, 'cohort': avg}:dict
+        """
+        table = [GRADE_POINTS.get(grade) for grade in self._grades]
+        rows, columns, stride = self._row_count, len(self._subject_names), self._stride
+        if np is not None:
+            points = np.array([np.nan if p is None else p for p in table] + [np.nan] * (256 - len(table)))
+            codes = np.frombuffer(self._codes, dtype=np.uint8).reshape(rows, stride)[:, :columns]
+            values = points[codes]
+            del codes  # release the buffer so the bytearray can grow again
+            present = ~np.isnan(values)
+            values[~present] = 0
+            row_sums, row_counts = values.sum(axis=1).tolist(), present.sum(axis=1).tolist()
+            column_sums, column_counts = values.sum(axis=0).tolist(), present.sum(axis=0).tolist()
+        else:
+            row_sums, row_counts = [0] * rows, [0] * rows
+            column_sums, column_counts = [0] * columns, [0] * columns
+            codes = self._codes
+            for row in range(rows):
+                base = row * stride
+                for column, code in enumerate(codes[base:base + columns]):
+                    point = table[code]
+                    if point is not None:
+                        row_sums[row] += point
+                        row_counts[row] += 1
+                        column_sums[column] += point
+                        column_counts[column] += 1
+        total, count = sum(column_sums), sum(column_counts)
+        return {
+            'students': {student: row_sums[row] / row_counts[row] if row_counts[row] else None
+                         for student, row in self._rows.items()},
+            'subjects': {subject: column_sums[column] / column_counts[column] if column_counts[column] else None
+                         for column, subject in enumerate(self._subject_names)},
+            'cohort': total / count if count else None
+        }
+
+
 class Student:
     @staticmethod
     def student_record(data: dict[str, dict]):
@@ -47,7 +527,7 @@ class Student:
     @staticmethod
     def bulk_student_registration(data):
         student_count=0
-        Default_grade='D'
+        Default_grade=DEFAULT_GRADE
         while(True):
             student=input("enter name of student or done to stop").strip()
             if student.lower()=='done':
@@ -70,6 +550,60 @@ class Student:
                     print(f'for {student} ,{subjects} these subjects are added')
         print(f"total number of registrations are:{student_count}")
     @staticmethod
+    def register_batch(data, rows):
+        """
+        Register many students in one pass, without input()
+        Same rules as bulk_student_registration: students already present
+        (or repeated in rows) are skipped and subjects without a grade get
+        DEFAULT_GRADE.
+        Args:
+        data: grade book to register into
+        rows: iterable of (student, subjects, grades); subjects and grades are
+              comma separated strings or lists, grades may be missing
+        Result:
+        counts of registered, skipped and rejected rows: dict
+        """
+        report = {'registered': 0, 'skipped': 0, 'rejected': 0}
+        batch = {}
+        for row in rows:
+            student, subjects, grades = (tuple(row) + (None, None))[:3]
+            student = (student or '').strip()
+            if isinstance(subjects, str):
+                subjects = subjects.split(',')
+            subjects = [s.strip() for s in subjects or () if s.strip()]
+            if not student or not subjects:
+                report['rejected'] += 1
+                continue
+            if student in batch or student in data:
+                report['skipped'] += 1
+                continue
+            if isinstance(grades, str):
+                grades = grades.split(',')
+            grades = [g.strip().upper() or DEFAULT_GRADE for g in grades or ()]
+            grades += [DEFAULT_GRADE] * (len(subjects) - len(grades))
+            batch[student] = dict(zip(subjects, grades))
+        data.update(batch)
+        report['registered'] = len(batch)
+        return report
+
+    @staticmethod
+    def register_csv(data, source):
+        """
+        register_batch() over a csv of student,subjects,grades rows
+        (header optional, subjects/grades comma separated inside quotes)
+        Args:
+        source: path or open text file
+        """
+        if isinstance(source, str):
+            with open(source, 'r', encoding='utf-8', newline='') as file:
+                return Student.register_csv(data, file)
+        rows = csv.reader(source)
+        first = next(rows, None)
+        if first is not None and [c.strip().lower() for c in first] != ['student', 'subjects', 'grades']:
+            rows = _chain([first], rows)
+        return Student.register_batch(data, rows)
+
+    @staticmethod
     def remove(data):
         response=input("want to remove student/subject:\n").strip()
         if response.lower()=='student':
@@ -80,9 +614,14 @@ class Student:
             subject=[s.strip() for s in subjects.split(',')]
             subject_response=input('remove from all students(Y)/from specific student(N),reply:Y/N :\n')
             if(subject_response.upper()=='Y'):
-                for student in data:
+                if isinstance(data, grade_store):
+                    # subject index: only students taking the subject are touched
                     for single_subject in subject:
-                        data[student].pop(single_subject,None)
+                        data.remove_subject(single_subject)
+                else:
+                    for student in data:
+                        for single_subject in subject:
+                            data[student].pop(single_subject,None)
             elif(subject_response.upper()=='N'):
                 student_name=input('enter student name:\n')
                 for single_subject in subject:
@@ -109,16 +648,9 @@ class Student:
         total_marks = 0
         subject_count = 0
         
-        # Grade to marks mapping - cleaner than if-elif chains
-        grade_points = {
-            'A+': 100, 'A': 90, 'B+': 85, 'B': 80, 
-            'C+': 75, 'C': 70, 'D+': 65, 'D': 60, 
-            'E': 50, 'F': 0
-        }
-        
         for subject, grade in student_subjects.items():  # Proper dictionary iteration
-            if grade in grade_points:
-                total_marks += grade_points[grade]
+            if grade in GRADE_POINTS:
+                total_marks += GRADE_POINTS[grade]
                 subject_count += 1
             else:
                 print(f'Invalid grade "{grade}" found for {subject}')
@@ -127,39 +659,87 @@ class Student:
         average = total_marks / subject_count
         print(f'{student} average grade is {average:.2f}')
 
+    @staticmethod
+    def subject_roster(data: grade_store):
+        """Show every student taking a subject with their grade"""
+        subject = input('Enter subject: ').strip()
+        roster = data.roster(subject)
+        if not roster:
+            print(f'No student takes {subject}')
+            return
+        print(f'--{subject} roster ({len(roster)} students)--')
+        for student, grade in roster.items():
+            print(f'{student}: {grade}')
+
+    @staticmethod
+    def leaderboard(data: grade_store):
+        """Show the top 10 students overall or for one subject"""
+        subject = input('Enter subject (or leave empty for overall): ').strip() or None
+        top = data.top_students(10, subject)
+        if not top:
+            print('No graded students found')
+            return
+        for rank, (student, marks) in enumerate(top, 1):
+            print(f'{rank:2}. {student}: {marks:.2f} (percentile {data.percentile(student, subject):.1f})')
+
+    @staticmethod
+    def cohort_averages(data: grade_store):
+        """Show whole-cohort and per-subject averages"""
+        if not data:
+            print('--Student record is empty--')
+            return
+        averages = data.averages()
+        if averages['cohort'] is None:
+            print('No valid grades found')
+            return
+        print(f"Cohort average grade is {averages['cohort']:.2f}")
+        for subject, average in averages['subjects'].items():
+            if average is not None:
+                print(f'  {subject}: {average:.2f}')
+
 # Main program
-records = {}
-
-while True:
-    print('\n--- Student Management System ---')
-    print('1) View records')
-    print('2) Add record')
-    print('3) Calculate average grade')
-    print('4) Bulk student registration')
-    print('5) remove student/subject')
-    print('6) exit')
+if __name__ == '__main__':
+    records = grade_store()
+
+    while True:
+        print('\n--- Student Management System ---')
+        print('1) View records')
+        print('2) Add record')
+        print('3) Calculate average grade')
+        print('4) Bulk student registration')
+        print('5) remove student/subject')
+        print('6) cohort and subject averages')
+        print('7) subject roster')
+        print('8) leaderboard')
+        print('9) exit')
     
-    try:
-        choose_number = int(input('Enter your choice: '))
+        try:
+            choose_number = int(input('Enter your choice: '))
         
-        if choose_number == 1:
-            Student.student_record(records)
-        elif choose_number == 2:
-            Student.add_record(records)  # Only pass records
-        elif choose_number == 3:
-            Student.average_grade(records)  # Only pass records
-        elif choose_number == 4:
-            Student.bulk_student_registration(records)
-        elif choose_number == 5:
-            Student.remove(records)
-        elif choose_number == 6:
-            print("exit")
-            break
-        else:
-            print('Invalid choice')
+            if choose_number == 1:
+                Student.student_record(records)
+            elif choose_number == 2:
+                Student.add_record(records)  # Only pass records
+            elif choose_number == 3:
+                Student.average_grade(records)  # Only pass records
+            elif choose_number == 4:
+                Student.bulk_student_registration(records)
+            elif choose_number == 5:
+                Student.remove(records)
+            elif choose_number == 6:
+                Student.cohort_averages(records)
+            elif choose_number == 7:
+                Student.subject_roster(records)
+            elif choose_number == 8:
+                Student.leaderboard(records)
+            elif choose_number == 9:
+                print("exit")
+                break
+            else:
+                print('Invalid choice')
             
-    except ValueError:
-        print('Invalid input. Please enter a number.')
-    except KeyboardInterrupt:
-        print('\nExiting...')
-        break
+        except ValueError:
+            print('Invalid input. Please enter a number.')
+        except KeyboardInterrupt:
+            print('\nExiting...')
+            break
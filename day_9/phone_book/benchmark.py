@@ -0,0 +1,51 @@
+"""Throughput of phone_book.bulk_import / bulk_export in rows/sec.
+
+usage: python benchmark.py [rows]   (default 1,000,000)
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from contact import contact_store, phone_book
+
+
+def make_rows(path, rows):
+    """Write a csv with some duplicate names and some invalid numbers."""
+    rng = random.Random(7)
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('name,phone\n')
+        for i in range(rows):
+            name = f'person{rng.randrange(rows)}'
+            if i % 50 == 0:
+                phone = '12345'
+            elif i % 2:
+                phone = f'{rng.randint(6, 9)}{rng.randrange(10**9):09d}'
+            else:
+                number = f'{rng.randint(6, 9)}{rng.randrange(10**9):09d}'
+                phone = f'{number[:3]}-{number[3:6]}-{number[6:]}'
+            file.write(f'{name},{phone}\n')
+
+
+def timed(label, rows, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f'{label:14}: {elapsed:6.2f}s  {rows / elapsed:12,.0f} rows/sec')
+    return result
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'contacts.csv')
+        make_rows(source, rows)
+        book = contact_store()
+        report = timed('import csv', rows, lambda: phone_book.bulk_import(book, source))
+        print(report)
+        for name in ('export.csv', 'export.jsonl'):
+            path = os.path.join(directory, name)
+            timed(f'export {name[7:]}', len(book), lambda: phone_book.bulk_export(book, path))
+        timed('import jsonl', len(book),
+              lambda: phone_book.bulk_import(contact_store(), os.path.join(directory, 'export.jsonl')))
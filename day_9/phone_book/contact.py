@@ -1,4 +1,234 @@
 import re
+import csv
+import json
+import os
+from bisect import bisect_left, insort
+
+PHONE_PATTERN=re.compile(r'^[6-9]\d{9}$|^[6-9]\d{2}[\s-]?\d{3}[\s-]?\d{4}$')
+BATCH_SIZE=10000 #rows committed to the phone book at a time during bulk import
+STORE_PATH='phone_book' #durable store files: phone_book.snapshot and phone_book.log
+
+def clean_number(phone:str):
+    return phone.replace(" ",'').replace('-','')
+
+def _fsync_directory(path:str):
+    """make a rename inside path's directory durable (a no-op where directories can't be opened)"""
+    try:
+        fd = os.open(os.path.dirname(path) or '.', os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+class contact_store(dict):
+    """name -> cleaned phone dict that keeps a sorted, case-insensitive name
+    index for prefix search and a number -> names reverse index in sync"""
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._by_number: dict[str, set[str]] = {}
+        self._name_index: list[tuple[str, str]] | None = []
+        self.update(*args, **kwargs)
+    def __setitem__(self, person:str, phone:str):
+        if person in self:
+            self._unindex(person, self[person], keep_name=True)
+        else:
+            self._index_name(person)
+        super().__setitem__(person, phone)
+        self._by_number.setdefault(phone, set()).add(person)
+    def __delitem__(self, person:str):
+        phone = self[person]
+        super().__delitem__(person)
+        self._unindex(person, phone)
+    def pop(self, person:str, *default):
+        if person not in self:
+            return super().pop(person, *default)
+        phone = self[person]
+        del self[person]
+        return phone
+    def popitem(self):
+        person, phone = super().popitem()
+        self._unindex(person, phone)
+        return person, phone
+    def clear(self):
+        super().clear()
+        self._by_number.clear()
+        self._name_index = []
+    def setdefault(self, person:str, phone:str=None):
+        if person not in self:
+            self[person] = phone
+        return self[person]
+    def update(self, *args, **kwargs):
+        items = dict(*args, **kwargs)
+        if len(items) > 1000:
+            # rebuilding once is cheaper than inserting many names one by one
+            self._name_index = None
+        for person, phone in items.items():
+            self[person] = phone
+    def __ior__(self, other):
+        # dict's |= would skip __setitem__ and leave the indexes stale
+        self.update(other)
+        return self
+    def copy(self):
+        """an in-memory contact_store with the same contacts"""
+        return contact_store(self)
+    # dict's own copy/pickle support would share or double the indexes,
+    # so every way of copying rebuilds the store from the plain contacts
+    def __copy__(self):
+        return self.copy()
+    def __deepcopy__(self, memo):
+        return self.copy()  # names and numbers are immutable strings
+    def __reduce__(self):
+        return contact_store, (dict(self),)
+    def _index_name(self, person:str):
+        if self._name_index is not None:
+            insort(self._name_index, (person.lower(), person))
+    def _unindex(self, person:str, phone:str, keep_name:bool=False):
+        names = self._by_number.get(phone)
+        if names is not None:
+            names.discard(person)
+            if not names:
+                del self._by_number[phone]
+        if not keep_name and self._name_index is not None:
+            index = self._name_index
+            position = bisect_left(index, (person.lower(), person))
+            if position < len(index) and index[position][1] == person:
+                del index[position]
+    def search_prefix(self, prefix:str):
+        """case-insensitive prefix search, returns [(name, phone)] sorted by name"""
+        if self._name_index is None:
+            self._name_index = sorted((person.lower(), person) for person in self)
+        index = self._name_index
+        prefix = prefix.lower()
+        matches = []
+        position = bisect_left(index, (prefix,))
+        while position < len(index) and index[position][0].startswith(prefix):
+            person = index[position][1]
+            matches.append((person, self[person]))
+            position += 1
+        return matches
+    def find_by_number(self, phone:str):
+        """names stored under a number, given in any format adding_data accepts"""
+        return sorted(self._by_number.get(clean_number(phone.strip()), ()))
+
+class durable_contact_store(contact_store):
+    """
+    contact_store persisted as a compacted snapshot plus an append-only log
+    of add/update ("A"), delete ("D") and clear ("C") records, one json list
+    per line. The in-memory dict is the hash index; on startup the snapshot
+    is loaded and only the log tail written since the last compaction is
+    replayed.
+    Args:
+    path:file prefix of the store:str
+    batch_size:log records buffered before they are written:int
+    fsync:force written batches to disk:bool
+    compact_min:log records always tolerated before compaction:int
+    compact_ratio:compact when the log holds more records than this times the live contacts:float
+    """
+    def __init__(self, path:str=STORE_PATH, batch_size:int=1000, fsync:bool=True,
+                 compact_min:int=10000, compact_ratio:float=2.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.fsync = fsync
+        self.compact_min = compact_min
+        self.compact_ratio = compact_ratio
+        self._pending: list[str] = []
+        self._log_records = 0
+        self._loading = True
+        super().__init__()
+        self._load()
+        self._loading = False
+        self._log = open(self.path + '.log', 'a', encoding='utf-8')
+    def _load(self):
+        state = {}
+        for suffix in ('.snapshot', '.log'):
+            good = 0  # byte offset just past the last complete record
+            try:
+                with open(self.path + suffix, 'rb') as file:
+                    for line in file:
+                        if not line.endswith(b'\n'):
+                            break  # torn write at the end of the log
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            break
+                        good += len(line)
+                        if record[0] == 'A':
+                            state[record[1]] = record[2]
+                        elif record[0] == 'D':
+                            state.pop(record[1], None)
+                        elif record[0] == 'C':
+                            state.clear()
+                        if suffix == '.log':
+                            self._log_records += 1
+                if suffix == '.log' and good < os.path.getsize(self.path + suffix):
+                    # cut the torn tail off, or the next append would be glued onto it
+                    os.truncate(self.path + suffix, good)
+            except FileNotFoundError:
+                pass
+        self.update(state)
+    def _append(self, *record):
+        if self._loading:
+            return
+        self._pending.append(json.dumps(record, ensure_ascii=False) + '\n')
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+    def __setitem__(self, person:str, phone:str):
+        super().__setitem__(person, phone)
+        self._append('A', person, phone)
+    def __delitem__(self, person:str):
+        super().__delitem__(person)
+        self._append('D', person)
+    def popitem(self):
+        person, phone = super().popitem()
+        self._append('D', person)
+        return person, phone
+    def clear(self):
+        super().clear()
+        self._append('C')
+    def _write_pending(self, fsync:bool):
+        if self._pending:
+            self._log.write(''.join(self._pending))
+            self._log_records += len(self._pending)
+            self._pending = []
+            self._log.flush()
+            if fsync:
+                os.fsync(self._log.fileno())
+    def flush(self):
+        """write buffered records to the log, compacting it when it grows too large"""
+        self._write_pending(self.fsync)
+        if self._log_records > max(self.compact_min, self.compact_ratio * len(self)):
+            self.compact()
+    def compact(self):
+        """rewrite the live contacts as a new snapshot and start an empty log"""
+        # the log must hold every change before the snapshot replaces the old
+        # one: a pending delete left out would be undone by replaying the old
+        # log over the new snapshot after a crash
+        self._write_pending(fsync=True)
+        temporary = self.path + '.snapshot.tmp'
+        with open(temporary, 'w', encoding='utf-8') as file:
+            for person, phone in self.items():
+                file.write(json.dumps(('A', person, phone), ensure_ascii=False) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self.path + '.snapshot')
+        _fsync_directory(self.path + '.snapshot')
+        # the log now only repeats changes already in the new snapshot, so a
+        # crash before the truncate below cannot lose or resurrect contacts
+        self._log.close()
+        self._log = open(self.path + '.log', 'w', encoding='utf-8')
+        self._log_records = 0
+    def close(self):
+        self.flush()
+        self._log.close()
+    def __enter__(self):
+        return self
+    def __exit__(self, *exc_info):
+        self.close()
+
 class phone_book:
     @staticmethod
     def main_menu(data:dict[str,str]):
@@ -6,7 +236,9 @@ class phone_book:
         print('2.) add/update contact')
         print('3.) look up for specific contact')
         print('4.) delete a contact')
-        print('5.) exit')
+        print('5.) search contacts by name prefix')
+        print('6.) find contact by phone number')
+        print('7.) exit')
     @staticmethod
     def view_data(data:dict[str,str]):
         if not data:
@@ -19,10 +251,9 @@ class phone_book:
     def adding_data(data:dict[str,str]):
         person=input('enter name of person').strip()
         phone=input('enter phone number').strip()
-        format=re.findall(r'^[6-9]\d{9}$|^[6-9]\d{2}[\s-]?\d{3}[\s-]?\d{4}$',phone)
-        if not format:
+        if not PHONE_PATTERN.match(phone):
             return '-wrong phone number format ***-****'
-        clean_phone=phone.replace(" ",'').replace('-','')
+        clean_phone=clean_number(phone)
         if person in data.keys():
             print(f'{person} already present')
             data.update({person: clean_phone})
@@ -37,28 +268,154 @@ class phone_book:
         else:
             return (f'{person} not in phone book')
     @staticmethod
+    def prefix_search(data:contact_store):
+        prefix=input('enter starting letters of name').strip()
+        matches=data.search_prefix(prefix)
+        if not matches:
+            return f'no contact starts with {prefix}'
+        return '\n'.join(f'{person}:{phone}' for person,phone in matches)
+    @staticmethod
+    def number_lookup(data:contact_store):
+        phone=input('enter phone number')
+        people=data.find_by_number(phone)
+        if not people:
+            return f'{phone} not in phone book'
+        return '\n'.join(f'{person}:{data[person]}' for person in people)
+    @staticmethod
+    def _read_rows(filename:str):
+        """yields (line number, name, phone) from a .csv (name,phone) or .jsonl file"""
+        with open(filename,'r',encoding='utf-8',newline='') as file:
+            if filename.endswith('.jsonl'):
+                for line_no,line in enumerate(file,start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        row=json.loads(line)
+                        person=row.get('name')
+                        phone=row.get('phone')
+                    except (ValueError,AttributeError):
+                        yield line_no,None,None
+                        continue
+                    if isinstance(phone,int) and not isinstance(phone,bool):
+                        phone=str(phone)  # numbers written without quotes
+                    if person is None:
+                        person=''  # reported as missing name
+                    if phone is None:
+                        phone=''
+                    if not isinstance(person,str) or not isinstance(phone,str):
+                        yield line_no,None,None
+                    else:
+                        yield line_no,person,phone
+            else:
+                for line_no,row in enumerate(csv.reader(file),start=1):
+                    if line_no==1 and [c.strip().lower() for c in row]==['name','phone']:
+                        continue
+                    if len(row)!=2:
+                        yield line_no,None,None
+                    else:
+                        yield line_no,row[0],row[1]
+    @staticmethod
+    def bulk_import(data:dict[str,str],filename:str,rejects_file:str|None=None):
+        """
+        stream contacts from a .csv or .jsonl file into the phone book
+        Args:
+        data:phone book to fill:dict[str,str]
+        filename:path of the file to import:str
+        rejects_file:optional path where rejected rows are written:str
+
+        Result:
+        counts of added, updated, duplicate (same name again in the file) and rejected rows:dict
+        """
+        report={'added':0,'updated':0,'duplicates':0,'rejected':0}
+        rejects=open(rejects_file,'w',encoding='utf-8') if rejects_file else None
+        batch={}
+        seen=set()
+        try:
+            for line_no,person,phone in phone_book._read_rows(filename):
+                if person is None:
+                    reason,person,phone='malformed row','',''
+                else:
+                    person=person.strip()
+                    phone=phone.strip()
+                    reason=None
+                    if not person:
+                        reason='missing name'
+                    elif not PHONE_PATTERN.match(phone):
+                        reason='wrong phone number format'
+                if reason:
+                    report['rejected']+=1
+                    if rejects:
+                        rejects.write(f'{line_no}\t{reason}\t{person}\t{phone}\n')
+                    continue
+                if person in seen:
+                    report['duplicates']+=1
+                elif person in data:
+                    report['updated']+=1
+                else:
+                    report['added']+=1
+                seen.add(person)
+                batch[person]=clean_number(phone)
+                if len(batch)>=BATCH_SIZE:
+                    data.update(batch)
+                    batch={}
+            data.update(batch)
+        finally:
+            if rejects:
+                rejects.close()
+        return report
+    @staticmethod
+    def bulk_export(data:dict[str,str],filename:str):
+        """stream the phone book into a .csv or .jsonl file, returns number of rows written"""
+        count=0
+        with open(filename,'w',encoding='utf-8',newline='') as file:
+            if filename.endswith('.jsonl'):
+                for person,phone in data.items():
+                    file.write(json.dumps({'name':person,'phone':phone},ensure_ascii=False)+'\n')
+                    count+=1
+            else:
+                writer=csv.writer(file)
+                writer.writerow(['name','phone'])
+                for person,phone in data.items():
+                    writer.writerow([person,phone])
+                    count+=1
+        return count
+    @staticmethod
     def remove_contact(data:dict[str,str]):
         person=input('enter name of person')
         data.pop(person,None)
         return (f'{person} is removed')
-contact_book={}
-while(True):
-    menu=phone_book.main_menu(contact_book)
-    choice=int(input('enter your choice'))
-    if choice==1:
-        complete_book=phone_book.view_data(contact_book)
-        print(complete_book)
-    elif(choice==2):
-        updating_data=phone_book.adding_data(contact_book)
-        print(updating_data)
-    elif(choice==3):
-        contact_finder=phone_book.lookup(contact_book)
-        print(contact_finder)
-    elif(choice==4):
-        data_removal=phone_book.remove_contact(contact_book)
-        print(data_removal)
-    elif(choice==5):
-        print('--thankyou--')
-        break
-    else:
-        print('wrong choice')
+if __name__=='__main__':
+    # every change is written to disk right away, so nothing is lost on a crash
+    contact_book=durable_contact_store(STORE_PATH,batch_size=1)
+    try:
+        while(True):
+            menu=phone_book.main_menu(contact_book)
+            try:
+                choice=int(input('enter your choice'))
+            except ValueError:
+                choice=0
+            if choice==1:
+                complete_book=phone_book.view_data(contact_book)
+                print(complete_book)
+            elif(choice==2):
+                updating_data=phone_book.adding_data(contact_book)
+                print(updating_data)
+            elif(choice==3):
+                contact_finder=phone_book.lookup(contact_book)
+                print(contact_finder)
+            elif(choice==4):
+                data_removal=phone_book.remove_contact(contact_book)
+                print(data_removal)
+            elif(choice==5):
+                matches=phone_book.prefix_search(contact_book)
+                print(matches)
+            elif(choice==6):
+                contact_finder=phone_book.number_lookup(contact_book)
+                print(contact_finder)
+            elif(choice==7):
+                print('--thankyou--')
+                break
+            else:
+                print('wrong choice')
+    finally:
+        contact_book.close()
@@ -0,0 +1,49 @@
+"""Compare the WordFrequencyAnalyzer engines on a synthetic text file.
+
+usage: python benchmark.py [size_in_mb]   (default 1024, i.e. 1 GB)
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from counter import WordFrequencyAnalyzer
+
+VOCABULARY = ['python', 'Data', 'science', 'LEARNING', 'web', 'development',
+              'community', 'libraries', 'is', 'a', 'to', 'and', 'für', 'café']
+STOPWORDS = {'is', 'a', 'to', 'and'}
+
+
+def make_corpus(path, size_mb):
+    """Write a synthetic corpus of about size_mb megabytes."""
+    rng = random.Random(42)
+    block = ' '.join(rng.choice(VOCABULARY) for _ in range(200_000)) + '\n'
+    block_bytes = block.encode('utf-8')
+    with open(path, 'wb') as file:
+        for _ in range(max(1, size_mb * 1024 * 1024 // len(block_bytes))):
+            file.write(block_bytes)
+
+
+def timed(label, func, size_mb):
+    start = time.perf_counter()
+    counts = func()
+    elapsed = time.perf_counter() - start
+    print(f'{label:10}: {elapsed:7.2f}s  ({size_mb / elapsed:7.1f} MB/s)')
+    return counts
+
+
+if __name__ == '__main__':
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'corpus.txt')
+        make_corpus(path, size_mb)
+        print(f'corpus: {os.path.getsize(path) / 1024 / 1024:.0f} MB')
+
+        results = [
+            timed('read', lambda: WordFrequencyAnalyzer(filename=path).analyze(3, STOPWORDS), size_mb),
+            timed('stream', lambda: WordFrequencyAnalyzer().analyze_stream(path, 3, STOPWORDS), size_mb),
+            timed('mmap', lambda: WordFrequencyAnalyzer().analyze_mmap(path, 3, STOPWORDS), size_mb),
+            timed('parallel', lambda: WordFrequencyAnalyzer().analyze_parallel(path, None, 3, STOPWORDS), size_mb),
+        ]
+        assert all(counts == results[0] for counts in results), 'engines disagree'
@@ -1,17 +1,153 @@
+from array import array
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import codecs
+import heapq
+import mmap
+import os
+from operator import itemgetter
 import re
+import struct
+import sys
+
+WORD_PATTERN = re.compile(r'\w+')
+CHUNK_SIZE = 1024 * 1024  # characters read per chunk in streaming mode
+MIN_RANGE_SIZE = 4 * 1024 * 1024  # smallest byte range handed to a worker
+WHITESPACE_BYTES = b' \t\n\r\f\v'
+# Bytes engine: ASCII word characters plus any UTF-8 multi-byte sequence.
+# Tokens containing non-ASCII bytes are re-tokenized as str afterwards.
+BYTES_TOKEN_PATTERN = re.compile(rb'[A-Za-z0-9_\x80-\xff]+')
+BYTES_SEPARATOR_PATTERN = re.compile(rb'[^A-Za-z0-9_\x80-\xff]')
+MMAP_WINDOW_SIZE = 16 * 1024 * 1024  # bytes scanned per findall() call
+# Snapshot layout: header, stopword section size, counts as little-endian
+# uint64 array, the sorted vocabulary and then the sorted stopwords, both as
+# newline separated UTF-8 (words never contain '\n').
+SNAPSHOT_MAGIC = b'WFC1'
+SNAPSHOT_HEADER = struct.Struct('<4sHHQQQQ')  # magic, version, min_length, words, total, length sum, vocab bytes
+SNAPSHOT_STOPWORDS = struct.Struct('<Q')  # stopword bytes, from version 2 on
+SNAPSHOT_VERSION = 2
+
+
+def _iter_word_chunks(pieces):
+    """Yield lowercased text chunks that never end in the middle of a word.
+
+    The cut is found on the raw text and only whole chunks are lowercased,
+    since str.lower() depends on context (a final sigma depends on what
+    follows it) and must see complete words.
+    """
+    tail = ''
+    for piece in pieces:
+        chunk = tail + piece
+        # Hold back a trailing partial word until the next piece arrives.
+        # Walking back by hand is far cheaper than a r'\w+$' search, which
+        # retries at every position of the chunk.
+        cut = len(chunk)
+        while cut and (chunk[cut - 1].isalnum() or chunk[cut - 1] == '_'):
+            cut -= 1
+        tail = chunk[cut:]
+        chunk = chunk[:cut]
+        if chunk:
+            yield chunk.lower()
+    if tail:
+        yield tail.lower()
+
+
+def _filters(min_length, exclude_words):
+    """Comparable form of the length and stopword filters.
+
+    A stopword containing '\n' can never match a word and is dropped.
+    """
+    return min_length, frozenset(w for w in exclude_words or () if '\n' not in w)
+
+
+def _count_words(chunks, min_length=1, exclude_words=None):
+    """Count the words of each chunk, applying the length and stopword filters."""
+    word_counts = Counter()
+    for chunk in chunks:
+        word_counts.update(WORD_PATTERN.findall(chunk))
+    # Filtering the distinct words once is much cheaper than filtering every token
+    if min_length > 1 or exclude_words:
+        exclude_words = exclude_words or ()
+        for word in [w for w in word_counts if len(w) < min_length or w in exclude_words]:
+            del word_counts[word]
+    return word_counts
+
+
+def _split_ranges(filename, parts):
+    """Split a file into at most `parts` byte ranges that start on whitespace.
+
+    ASCII whitespace never occurs inside a UTF-8 multi-byte sequence, so
+    every range can be decoded and tokenized on its own.
+    """
+    size = os.path.getsize(filename)
+    parts = max(1, min(parts, size // MIN_RANGE_SIZE))
+    boundaries = [0]
+    with open(filename, 'rb') as file:
+        for i in range(1, parts):
+            position = max(size * i // parts, boundaries[-1])
+            file.seek(position)
+            while True:
+                block = file.read(64 * 1024)
+                if not block:
+                    position = size
+                    break
+                offsets = [block.find(c) for c in WHITESPACE_BYTES]
+                offsets = [o for o in offsets if o != -1]
+                if offsets:
+                    position += min(offsets)
+                    break
+                position += len(block)
+            boundaries.append(position)
+    boundaries.append(size)
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def _read_range(filename, start, end, chunk_size=CHUNK_SIZE):
+    """Yield decoded text pieces for the bytes [start, end) of a file."""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = file.read(min(chunk_size, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            yield decoder.decode(block)
+    yield decoder.decode(b'', final=True)
+
+
+def _count_range(filename, start, end, min_length=1, exclude_words=None):
+    """Worker entry point: count the words in one byte range of a file."""
+    return _count_words(_iter_word_chunks(_read_range(filename, start, end)), min_length, exclude_words)
+
 
 class WordFrequencyAnalyzer:
     """Complete word frequency analyzer with multiple features."""
     
-    def __init__(self, text=None, filename=None):
-        """Initialize with text or file."""
-        if filename:
+    def __init__(self, text=None, filename=None, stream=False, top_k=100):
+        """Initialize with text or file.
+
+        With stream=True the file is not loaded up front; analyze() reads
+        it chunk by chunk instead. top_k is how many leading words are kept
+        ranked while counts are updated incrementally.
+        """
+        self.filename = filename
+        self.stream = bool(filename) and stream
+        if filename and not self.stream:
             self.text = self._read_file(filename)
         else:
             self.text = text or ""
         
         self.word_counts = None
+        self.min_length = 1
+        self.exclude_words = None
+        self.top_k = top_k
+        self.total_words = 0
+        self.total_length = 0
+        self._top = {}
+        self._top_heap = []
+        self._statistics = None
     
     def _read_file(self, filename):
         """Read text from file."""
@@ -22,10 +158,99 @@ class WordFrequencyAnalyzer:
             print(f"Error: File '{filename}' not found.")
             return ""
     
+    def analyze_stream(self, filename=None, min_length=1, exclude_words=None, chunk_size=CHUNK_SIZE):
+        """Analyze word frequencies reading the file in fixed-size chunks.
+
+        Memory stays bounded by the vocabulary size, not the file size.
+        """
+        filename = filename or self.filename
+        word_counts = Counter()
+        try:
+            with open(filename, 'r', encoding='utf-8') as file:
+                pieces = iter(lambda: file.read(chunk_size), '')
+                word_counts = _count_words(_iter_word_chunks(pieces), min_length, exclude_words)
+        except FileNotFoundError:
+            print(f"Error: File '{filename}' not found.")
+        
+        return self._set_counts(word_counts, min_length, exclude_words)
+
+    def analyze_parallel(self, filenames=None, workers=None, min_length=1, exclude_words=None):
+        """Analyze one or more files across a pool of worker processes.
+
+        Each file is split into byte ranges aligned on whitespace, every range
+        is counted in its own process and the partial Counters are merged.
+        The result is identical to analyze()/analyze_stream().
+        """
+        filenames = filenames or self.filename
+        if isinstance(filenames, str):
+            filenames = [filenames]
+        workers = workers or os.cpu_count() or 1
+        exclude_words = frozenset(exclude_words or ())
+        
+        tasks = []
+        for filename in filenames:
+            try:
+                ranges = _split_ranges(filename, workers)
+            except FileNotFoundError:
+                print(f"Error: File '{filename}' not found.")
+                continue
+            tasks.extend((filename, start, end, min_length, exclude_words) for start, end in ranges)
+        
+        word_counts = Counter()
+        if workers == 1 or len(tasks) <= 1:
+            for task in tasks:
+                word_counts.update(_count_range(*task))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for partial in executor.map(_count_range, *zip(*tasks)):
+                    word_counts.update(partial)
+        
+        return self._set_counts(word_counts, min_length, exclude_words)
+
+    def analyze_mmap(self, filename=None, min_length=1, exclude_words=None, window_size=MMAP_WINDOW_SIZE):
+        """Analyze an ASCII/UTF-8 file by running a bytes regex over an mmap.
+
+        The file is never decoded or lowercased as a whole: raw tokens are
+        counted straight from the mapped buffer window by window, and only
+        the distinct tokens are decoded and lowercased at the end.
+        """
+        filename = filename or self.filename
+        raw_counts = Counter()
+        try:
+            with open(filename, 'rb') as file:
+                size = os.fstat(file.fileno()).st_size
+                if size:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                        pos = 0
+                        while pos < size:
+                            # Extend the window to the next separator so no token is cut
+                            match = BYTES_SEPARATOR_PATTERN.search(buffer, min(pos + window_size, size))
+                            end = match.start() if match else size
+                            raw_counts.update(BYTES_TOKEN_PATTERN.findall(buffer, pos, end))
+                            pos = end + 1
+        except FileNotFoundError:
+            print(f"Error: File '{filename}' not found.")
+        
+        exclude_words = exclude_words or ()
+        word_counts = Counter()
+        for token, count in raw_counts.items():
+            if token.isascii():
+                words = [token.lower().decode('ascii')]
+            else:
+                words = WORD_PATTERN.findall(token.decode('utf-8', 'replace').lower())
+            for word in words:
+                if len(word) >= min_length and word not in exclude_words:
+                    word_counts[word] += count
+        
+        return self._set_counts(word_counts, min_length, exclude_words)
+
     def analyze(self, min_length=1, exclude_words=None):
         """Analyze word frequencies."""
+        if self.stream:
+            return self.analyze_stream(min_length=min_length, exclude_words=exclude_words)
+        
         # Clean and tokenize
-        words = re.findall(r'\w+', self.text.lower())
+        words = WORD_PATTERN.findall(self.text.lower())
         
         # Filter by length
         words = [w for w in words if len(w) >= min_length]
@@ -35,29 +260,184 @@ class WordFrequencyAnalyzer:
             words = [w for w in words if w not in exclude_words]
         
         # Count
-        self.word_counts = Counter(words)
+        return self._set_counts(Counter(words), min_length, exclude_words)
+    
+    def _set_counts(self, word_counts, min_length=1, exclude_words=None, totals=None):
+        """Replace the counts and rebuild the running totals and top-k ranking.
+
+        totals=(total_words, total_length) skips recomputing known totals.
+        """
+        self.word_counts = word_counts
+        self.min_length = min_length
+        self.exclude_words = exclude_words
+        if totals is None:
+            totals = (sum(word_counts.values()), sum(len(w) * c for w, c in word_counts.items()))
+        self.total_words, self.total_length = totals
+        self._top = dict(heapq.nlargest(self.top_k, word_counts.items(), key=itemgetter(1)))
+        self._top_heap = [(count, word) for word, count in self._top.items()]
+        heapq.heapify(self._top_heap)
+        self._statistics = None
+        return self.word_counts
+    
+    def _merge_counts(self, new_counts):
+        """Add new counts and update the totals and top-k ranking incrementally."""
+        if self.word_counts is None:
+            self.analyze(self.min_length, self.exclude_words)
         
+        word_counts = self.word_counts
+        word_counts.update(new_counts)
+        for word, count in new_counts.items():
+            self.total_words += count
+            self.total_length += len(word) * count
+            self._promote(word, word_counts[word])
+        self._statistics = None
         return self.word_counts
     
+    def _promote(self, word, count):
+        """Keep the top-k ranking exact as a word's count grows.
+
+        Counts only ever increase here, so a word outside the top-k can only
+        enter it by overtaking the current minimum. Outdated heap entries are
+        skipped lazily.
+        """
+        if self.top_k <= 0:
+            return
+        top, heap = self._top, self._top_heap
+        if word in top:
+            top[word] = count
+            heapq.heappush(heap, (count, word))
+        elif len(top) < self.top_k:
+            top[word] = count
+            heapq.heappush(heap, (count, word))
+        else:
+            while top.get(heap[0][1]) != heap[0][0]:
+                heapq.heappop(heap)
+            if count <= heap[0][0]:
+                return
+            del top[heapq.heapreplace(heap, (count, word))[1]]
+            top[word] = count
+        if len(heap) > 4 * self.top_k:
+            self._top_heap = [(c, w) for w, c in top.items()]
+            heapq.heapify(self._top_heap)
+    
+    def add_text(self, text, min_length=None, exclude_words=None):
+        """Count additional text on top of the existing counts.
+
+        Only the new text is tokenized; the filters default to the ones used
+        by the last analyze() call.
+        """
+        min_length = self.min_length if min_length is None else min_length
+        exclude_words = self.exclude_words if exclude_words is None else exclude_words
+        return self._merge_counts(_count_words([text.lower()], min_length, exclude_words))
+    
+    def add_file(self, filename, min_length=None, exclude_words=None, chunk_size=CHUNK_SIZE):
+        """Count an additional file, streamed in chunks, on top of the existing counts."""
+        min_length = self.min_length if min_length is None else min_length
+        exclude_words = self.exclude_words if exclude_words is None else exclude_words
+        try:
+            with open(filename, 'r', encoding='utf-8') as file:
+                pieces = iter(lambda: file.read(chunk_size), '')
+                new_counts = _count_words(_iter_word_chunks(pieces), min_length, exclude_words)
+        except FileNotFoundError:
+            print(f"Error: File '{filename}' not found.")
+            new_counts = Counter()
+        return self._merge_counts(new_counts)
+    
+    def save_snapshot(self, filename):
+        """Save the counts and running totals to a compact binary snapshot."""
+        if self.word_counts is None:
+            self.analyze()
+        
+        vocabulary = sorted(self.word_counts)
+        counts = array('Q', [self.word_counts[w] for w in vocabulary])
+        if sys.byteorder == 'big':
+            counts.byteswap()
+        vocabulary_bytes = '\n'.join(vocabulary).encode('utf-8')
+        min_length, stopwords = _filters(self.min_length, self.exclude_words)
+        stopword_bytes = '\n'.join(sorted(stopwords)).encode('utf-8')
+        with open(filename, 'wb') as file:
+            file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, min_length, len(vocabulary),
+                                            self.total_words, self.total_length, len(vocabulary_bytes)))
+            file.write(SNAPSHOT_STOPWORDS.pack(len(stopword_bytes)))
+            counts.tofile(file)
+            file.write(vocabulary_bytes)
+            file.write(stopword_bytes)
+    
+    def load_snapshot(self, filename, merge=False):
+        """Load counts saved by save_snapshot() without re-reading any text.
+
+        The length and stopword filters of the snapshot are restored, so
+        later add_text()/add_file() calls keep applying them. With
+        merge=True the snapshot is added to the current counts, which
+        combines results of runs sharded across files or machines; both
+        must have been counted with the same filters.
+        """
+        with open(filename, 'rb') as file:
+            magic, version, min_length, size, total_words, total_length, vocabulary_size = \
+                SNAPSHOT_HEADER.unpack(file.read(SNAPSHOT_HEADER.size))
+            if magic != SNAPSHOT_MAGIC or version not in (1, SNAPSHOT_VERSION):
+                raise ValueError(f"'{filename}' is not a word count snapshot")
+            stopword_size = 0  # version 1 snapshots did not record stopwords
+            if version > 1:
+                stopword_size, = SNAPSHOT_STOPWORDS.unpack(file.read(SNAPSHOT_STOPWORDS.size))
+            counts = array('Q')
+            counts.fromfile(file, size)
+            vocabulary = file.read(vocabulary_size).decode('utf-8').split('\n') if size else []
+            stopwords = file.read(stopword_size).decode('utf-8').split('\n') if stopword_size else []
+        if sys.byteorder == 'big':
+            counts.byteswap()
+        
+        exclude_words = frozenset(stopwords) or None
+        loaded = Counter(dict(zip(vocabulary, counts)))
+        if merge and self.word_counts is not None:
+            if _filters(self.min_length, self.exclude_words) != _filters(min_length, exclude_words):
+                raise ValueError(f"'{filename}' was counted with different min_length or stopwords")
+            return self._merge_counts(loaded)
+        return self._set_counts(loaded, min_length, exclude_words, totals=(total_words, total_length))
+    
     def get_top_words(self, n=10):
         """Get top N most common words."""
         if self.word_counts is None:
             self.analyze()
+        if n is not None and n <= len(self._top) or len(self._top) == len(self.word_counts):
+            return sorted(self._top.items(), key=itemgetter(1), reverse=True)[:n]
         return self.word_counts.most_common(n)
     
+    def get_bottom_words(self, n=10):
+        """Get the N least common words using a bounded heap instead of a full sort."""
+        if self.word_counts is None:
+            self.analyze()
+        return heapq.nsmallest(n, self.word_counts.items(), key=itemgetter(1))
+    
+    def get_words_above(self, threshold):
+        """Get all words with count > threshold, most common first.
+
+        Answered from the maintained top-k ranking when it already reaches
+        below the threshold; otherwise the vocabulary is scanned once.
+        """
+        if self.word_counts is None:
+            self.analyze()
+        top = self._top
+        if len(top) == len(self.word_counts) or top and min(top.values()) <= threshold:
+            words = [(w, c) for w, c in top.items() if c > threshold]
+        else:
+            words = [(w, c) for w, c in self.word_counts.items() if c > threshold]
+        words.sort(key=itemgetter(1), reverse=True)
+        return words
+    
     def get_statistics(self):
-        """Get text statistics."""
+        """Get text statistics, cached until the counts change."""
         if self.word_counts is None:
             self.analyze()
         
-        total_words = sum(self.word_counts.values())
-        unique_words = len(self.word_counts)
-        
-        return {
-            'total_words': total_words,
-            'unique_words': unique_words,
-            'avg_word_length': sum(len(w) * c for w, c in self.word_counts.items()) / total_words
-        }
+        if self._statistics is None:
+            total_words = self.total_words
+            self._statistics = {
+                'total_words': total_words,
+                'unique_words': len(self.word_counts),
+                'avg_word_length': self.total_length / total_words if total_words else 0
+            }
+        return dict(self._statistics)
     
     def display_report(self, top_n=10):
         """Display comprehensive report."""
@@ -84,27 +464,27 @@ class WordFrequencyAnalyzer:
         print("=" * 50)
 
 # Example usage
-text = """
-Python is a versatile programming language. Python is easy to learn.
-Many developers choose Python for web development. Python is powerful.
-Data science and machine learning use Python extensively.
-Python has a large community and many libraries.
-"""
+if __name__ == "__main__":
+    text = """
+    Python is a versatile programming language. Python is easy to learn.
+    Many developers choose Python for web development. Python is powerful.
+    Data science and machine learning use Python extensively.
+    Python has a large community and many libraries.
+    """
 
-# Common English stopwords to exclude
-stopwords = {'is', 'a', 'to', 'and', 'for', 'has', 'the', 'in'}
+    # Common English stopwords to exclude
+    stopwords = {'is', 'a', 'to', 'and', 'for', 'has', 'the', 'in'}
 
-# Create analyzer
-analyzer = WordFrequencyAnalyzer(text=text)
+    # Create analyzer
+    analyzer = WordFrequencyAnalyzer(text=text)
 
-# Analyze with options
-analyzer.analyze(min_length=3, exclude_words=stopwords)
+    # Analyze with options
+    analyzer.analyze(min_length=3, exclude_words=stopwords)
 
-# Display report
-analyzer.display_report(top_n=10)
+    # Display report
+    analyzer.display_report(top_n=10)
 
-# Get specific results
-print("\nWords appearing more than once:")
-for word, count in analyzer.word_counts.items():
-    if count > 1:
+    # Get specific results
+    print("\nWords appearing more than once:")
+    for word, count in analyzer.get_words_above(1):
         print(f"  {word}: {count}")